@@ -0,0 +1,21 @@
+"""Shared test fixtures"""
+
+import importlib.util
+import sys
+import types
+
+import pytest
+
+
+@pytest.fixture
+def load_uncompiled(monkeypatch):
+    """Load a copy of a kernel module whose ``njit`` leaves the loop kernels as plain Python"""
+    def load(module):
+        fake_numba = types.ModuleType('numba')
+        fake_numba.njit = lambda **options: (lambda func: func)
+        monkeypatch.setitem(sys.modules, 'numba', fake_numba)
+        spec = importlib.util.spec_from_file_location(f"{module.__name__}_uncompiled", module.__file__)
+        copy = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(copy)
+        return copy
+    return load
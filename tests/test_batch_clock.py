@@ -0,0 +1,64 @@
+"""Tests for the per-batch clock"""
+
+import asyncio
+import time
+
+from unified_agentos._batch_clock import BatchClock
+
+clock = BatchClock('test_batch_clock')
+
+
+def test_batch_reuses_one_reading():
+    with clock.batch():
+        first = clock.now()
+        time.sleep(0.002)
+        assert clock.now() == first
+        assert clock.now_iso() == first.isoformat()
+
+
+def test_clock_is_live_outside_a_batch():
+    with clock.batch():
+        batch_time = clock.now()
+    time.sleep(0.002)
+    assert clock.now() > batch_time
+    first = clock.now()
+    time.sleep(0.002)
+    assert clock.now() > first
+
+
+def test_concurrent_batches_keep_their_own_reading():
+    async def worker(delay):
+        await asyncio.sleep(delay)
+        with clock.batch():
+            start = clock.now()
+            await asyncio.sleep(0.01)
+            return start, clock.now()
+
+    async def run():
+        return await asyncio.gather(worker(0), worker(0.005))
+
+    (start_a, end_a), (start_b, end_b) = asyncio.run(run())
+    assert start_a == end_a
+    assert start_b == end_b
+    assert start_a != start_b
+
+
+def test_tasks_started_in_a_batch_read_the_live_clock_after_it_ends():
+    async def read_later():
+        await asyncio.sleep(0.01)
+        return clock.now()
+
+    async def run():
+        with clock.batch():
+            batch_time = clock.now()
+            reader = asyncio.ensure_future(read_later())
+        return batch_time, await reader
+
+    batch_time, later = asyncio.run(run())
+    assert later > batch_time
+
+
+def test_stamps_are_unique_within_a_batch():
+    with clock.batch():
+        stamps = {clock.next_stamp() for _ in range(1000)}
+    assert len(stamps) == 1000
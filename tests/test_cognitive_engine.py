@@ -0,0 +1,51 @@
+"""Tests for the cognitive engine"""
+
+import asyncio
+
+from unified_agentos.cognitive_engine import CognitiveEngine, CognitiveProcessType
+from unified_agentos.memory_interface import UnifiedMemoryInterface
+from unified_agentos.message_bus import UnifiedMessageBus
+
+
+def make_engine() -> CognitiveEngine:
+    return CognitiveEngine(UnifiedMemoryInterface({}), UnifiedMessageBus())
+
+
+def test_repeated_reflection_reflects_on_new_history():
+    async def run():
+        engine = make_engine()
+        await engine.process_cognitive_request("agent1", CognitiveProcessType.REASONING, {"query": "why"})
+        first = await engine.process_cognitive_request("agent1", CognitiveProcessType.REFLECTION, {})
+        second = await engine.process_cognitive_request("agent1", CognitiveProcessType.REFLECTION, {})
+        return engine, first, second
+
+    engine, first, second = asyncio.run(run())
+    assert first is not second
+    # The second reflection covers the first one
+    assert second.result_data != first.result_data
+    assert len(engine.cognitive_histories["agent1"]) == 3
+
+
+def test_cognitive_history_callers_cannot_change_the_cache():
+    async def run():
+        engine = make_engine()
+        await engine.process_cognitive_request("agent2", CognitiveProcessType.REASONING, {"query": "why"})
+        history = engine.get_cognitive_history("agent2")
+        history.clear()
+        return engine.get_cognitive_history("agent2")
+
+    assert len(asyncio.run(run())) == 1
+
+
+def test_cognitive_stats_callers_cannot_change_the_cache():
+    async def run():
+        engine = make_engine()
+        await engine.process_cognitive_request("agent3", CognitiveProcessType.REASONING, {"query": "why"})
+        stats = engine.get_cognitive_stats("agent3")
+        stats['total_processes'] = 0
+        stats['process_distribution'].clear()
+        return engine.get_cognitive_stats("agent3")
+
+    stats = asyncio.run(run())
+    assert stats['total_processes'] == 1
+    assert sum(stats['process_distribution'].values()) == 1
@@ -0,0 +1,26 @@
+"""Tests that the cognitive kernels agree with their NumPy fallbacks"""
+
+import numpy as np
+import pytest
+
+from unified_agentos import _cognitive_kernels
+
+
+@pytest.fixture(params=['module', 'uncompiled'])
+def kernels(request, load_uncompiled):
+    if request.param == 'module':
+        return _cognitive_kernels
+    return load_uncompiled(_cognitive_kernels)
+
+
+@pytest.mark.parametrize('n', [0, 1, 7, 20])
+def test_avg_and_diversity_matches_numpy_fallback(kernels, n):
+    rng = np.random.default_rng(n)
+    conf = rng.uniform(0.0, 1.0, 20)
+    type_codes = rng.integers(0, 5, 20).astype(np.uint8)
+
+    kernel_avg, kernel_diversity = kernels.avg_and_diversity(conf, type_codes, n)
+    fallback_avg, fallback_diversity = _cognitive_kernels._avg_and_diversity_numpy(conf, type_codes, n)
+
+    assert kernel_avg == pytest.approx(fallback_avg)
+    assert kernel_diversity == fallback_diversity
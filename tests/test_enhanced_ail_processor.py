@@ -0,0 +1,275 @@
+"""Tests for the enhanced AIL processor"""
+
+import asyncio
+import gc
+
+import pytest
+
+from unified_agentos.attention_manager import AttentionManager
+from unified_agentos.cognitive_engine import CognitiveEngine, CognitiveProcessType
+from unified_agentos.enhanced_ail_processor import (
+    AILMessageType,
+    AILProcessingResult,
+    CognitiveIntentType,
+    EnhancedAILMessage,
+    EnhancedAILProcessor,
+    _MicroBatcher,
+)
+from unified_agentos.learning_loop import LearningLoop
+from unified_agentos.memory_interface import MemoryItem, MemoryType, UnifiedMemoryInterface
+from unified_agentos.message_bus import Message, MessageType, UnifiedMessageBus
+
+
+def make_processor(**options) -> EnhancedAILProcessor:
+    memory = UnifiedMemoryInterface({})
+    bus = UnifiedMessageBus()
+    engine = CognitiveEngine(memory, bus)
+    return EnhancedAILProcessor(memory, bus, engine, AttentionManager(memory, bus),
+                                LearningLoop(memory, bus, engine), **options)
+
+
+def make_message(message_id: str, **fields) -> EnhancedAILMessage:
+    return EnhancedAILMessage(message_id=message_id, sender_id="agent2", receiver_id="agent1",
+                              message_type=AILMessageType.NOTIFICATION,
+                              cognitive_intent=CognitiveIntentType.INFORM, content="status update", **fields)
+
+
+def test_processing_adds_updates_above_thresholds_only():
+    async def run():
+        processor = make_processor()
+        hot = await processor._process_enhanced_message(
+            make_message("hot", attention_priority=0.9, learning_value=0.9))
+        cold = await processor._process_enhanced_message(
+            make_message("cold", attention_priority=0.1, learning_value=0.1))
+        return hot, cold
+
+    hot, cold = asyncio.run(run())
+    assert hot.processed and cold.processed
+    assert [target.target_id for target in hot.attention_updates] == ["hot"]
+    assert [exp.experience_id for exp in hot.learning_experiences] == ["msg_learning_hot"]
+    assert not cold.attention_updates and not cold.learning_experiences
+
+
+def test_registered_handler_replaces_dispatch():
+    handled = []
+
+    async def handle(message):
+        handled.append(message.message_id)
+        return {}
+
+    processor = make_processor()
+    with pytest.raises(TypeError):
+        processor.message_handlers[AILMessageType.NOTIFICATION] = handle
+    processor.register_message_handler(AILMessageType.NOTIFICATION, handle)
+
+    result = asyncio.run(processor._process_enhanced_message(make_message("m1")))
+    assert result.processed
+    assert handled == ["m1"]
+    assert processor.message_handlers[AILMessageType.NOTIFICATION] is handle
+
+
+def test_stop_delivers_buffered_bus_messages():
+    sent = []
+
+    async def record(bus_message):
+        sent.append(bus_message.message_id)
+        return True
+
+    async def run():
+        processor = make_processor()
+        processor.message_bus.send_message = record
+        await processor.start()
+        outbox = processor._get_outbox()
+        for i in range(3):
+            await outbox.put(Message(message_id=f"m{i}", sender_id="agent2", recipient_id="agent1",
+                                     message_type=MessageType.AIL_COGNITION, content="hello"))
+        # Let the flusher pick up the first message and start waiting for the rest
+        await asyncio.sleep(0)
+        await processor.stop()
+
+    asyncio.run(run())
+    assert sent == ["m0", "m1", "m2"]
+
+
+async def processed_within(processor, messages, seconds):
+    """Send messages to a registered agent1 and return the ids processed within ``seconds``"""
+    processed = []
+    process = processor._process_enhanced_message
+
+    async def record(message):
+        processed.append(message.message_id)
+        return await process(message)
+
+    processor._process_enhanced_message = record
+    await processor.attention_manager.register_agent("agent1")
+    await processor.start()
+    await processor.send_enhanced_ail_messages(messages)
+    await asyncio.sleep(seconds)
+    await processor.stop()
+    return processed
+
+
+def test_messages_over_attention_capacity_drain_without_idle_wait():
+    async def run():
+        processor = make_processor()
+        processor.idle_recheck_interval = 5.0
+        messages = [make_message(f"m{i}", attention_priority=0.9) for i in range(20)]
+        return await processed_within(processor, messages, 1.0)
+
+    # Attention accepts 3 messages per pass; the rest are re-queued and picked up right away
+    assert sorted(asyncio.run(run())) == sorted(f"m{i}" for i in range(20))
+
+
+def test_deferred_messages_are_reoffered_before_idle_recheck():
+    async def run():
+        processor = make_processor()
+        processor.idle_recheck_interval = 5.0
+        # Low priority from a sender agent1 has not attended to: deferred by the prefilter
+        messages = [make_message(f"m{i}", attention_priority=0.2) for i in range(2)]
+        return await processed_within(processor, messages, 1.0)
+
+    assert sorted(asyncio.run(run())) == ["m0", "m1"]
+
+
+def test_prefiltered_messages_are_offered_under_steady_traffic():
+    processed = []
+
+    async def run():
+        processor = make_processor()
+        processor.deferred_recheck_interval = processor.idle_recheck_interval = 5.0
+        process = processor._process_enhanced_message
+
+        async def record(message):
+            processed.append(message.message_id)
+            return await process(message)
+
+        processor._process_enhanced_message = record
+        await processor.start()
+        quiet = make_message("quiet", attention_priority=0.2)
+        quiet.sender_id = "agent3"
+        await processor.send_enhanced_ail_message(quiet)
+        # Steady traffic keeps the worker awake, so its wait never times out
+        for i in range(15):
+            await processor.send_enhanced_ail_message(make_message(f"busy{i}", attention_priority=0.9))
+            await asyncio.sleep(0.1)
+        await processor.stop()
+
+    asyncio.run(run())
+    assert "quiet" in processed
+
+
+def test_attended_senders_expire_and_are_bounded():
+    processor = make_processor()
+    processor.max_attended_senders = 2
+    messages = [make_message(f"m{i}") for i in range(3)]
+    for i, message in enumerate(messages):
+        message.sender_id = f"sender{i}"
+    processor._record_attended_senders("agent1", messages)
+    assert list(processor._recent_senders("agent1")) == ["sender1", "sender2"]
+
+    processor.attended_sender_ttl = 0.0
+    assert processor._recent_senders("agent1") == {}
+
+
+def test_micro_batcher_close_flushes_held_items():
+    flushed = []
+
+    async def double(items):
+        flushed.append(list(items))
+        return [item * 2 for item in items]
+
+    async def run():
+        batcher = _MicroBatcher(double, max_wait=0.05)
+        futures = [batcher.submit(i) for i in range(3)]
+        # The batching task is now holding the items while it waits for more
+        await asyncio.sleep(0)
+        await batcher.close()
+        return [future.result() for future in futures]
+
+    assert asyncio.run(run()) == [0, 2, 4]
+    assert flushed == [[0, 1, 2]]
+
+
+def test_micro_batcher_cancellation_fails_held_futures():
+    async def echo(items):
+        return items
+
+    async def run():
+        batcher = _MicroBatcher(echo, max_wait=0.05)
+        future = batcher.submit("item")
+        await asyncio.sleep(0)
+        batcher._task.cancel()
+        await asyncio.gather(batcher._task, return_exceptions=True)
+        return future
+
+    future = asyncio.run(run())
+    with pytest.raises(RuntimeError):
+        future.result()
+
+
+def test_micro_batcher_short_flush_fails_unmatched_futures():
+    async def first_only(items):
+        return items[:1]
+
+    async def run():
+        batcher = _MicroBatcher(first_only)
+        futures = [batcher.submit(i) for i in range(2)]
+        await batcher.close()
+        return futures
+
+    first, second = asyncio.run(run())
+    assert first.result() == 0
+    with pytest.raises(RuntimeError):
+        second.result()
+
+
+def test_memory_updates_are_kept_when_background_writes_are_full():
+    async def run():
+        processor = make_processor()
+        processor.max_cold_tasks = 0
+        await processor.start()
+        for i in range(3):
+            await processor._handle_processing_result(AILProcessingResult(
+                message_id=f"m{i}",
+                memory_updates=[MemoryItem(memory_id=f"update_{i}", agent_id="backpressure_agent",
+                                           memory_type=MemoryType.EPISODIC, content=f"update {i}")]
+            ))
+        await processor.stop()
+        return processor.memory_interface
+
+    memory = asyncio.run(run())
+    assert len(memory._agent_memories["backpressure_agent"]) == 3
+
+
+def test_gc_is_only_frozen_when_requested():
+    async def run(**options):
+        processor = make_processor(**options)
+        await processor.start()
+        frozen = gc.get_freeze_count()
+        await processor.stop()
+        return frozen, gc.get_freeze_count()
+
+    assert asyncio.run(run()) == (0, 0)
+    frozen, after_stop = asyncio.run(run(freeze_gc=True))
+    assert frozen > 0
+    assert after_stop == 0
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("Why did the deploy fail?", {CognitiveProcessType.REASONING}),
+    ("Explain the reasoning behind it", {CognitiveProcessType.REASONING}),
+    ("Which options do we have?", {CognitiveProcessType.DECISION_MAKING}),
+    ("We are planning the rollout", {CognitiveProcessType.PLANNING}),
+    ("I am learning the codebase", {CognitiveProcessType.LEARNING}),
+    ("Let us think about it", {CognitiveProcessType.REFLECTION}),
+    ("Evaluate the results", {CognitiveProcessType.EVALUATION}),
+    ("An accurate, generated explanation", set()),
+])
+def test_content_analysis_matches_inflected_keywords(content, expected):
+    processes, _ = EnhancedAILProcessor._analyze_content(content)
+    assert set(processes) == expected
+
+
+def test_content_analysis_detects_complexity():
+    assert EnhancedAILProcessor._analyze_content("A detailed plan")[1] == 1
+    assert EnhancedAILProcessor._analyze_content("A plan")[1] == 0
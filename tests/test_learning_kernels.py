@@ -0,0 +1,29 @@
+"""Tests that the learning kernels agree with their NumPy fallbacks"""
+
+import numpy as np
+import pytest
+
+from unified_agentos import _learning_kernels
+
+
+@pytest.fixture(params=['module', 'uncompiled'])
+def kernels(request, load_uncompiled):
+    if request.param == 'module':
+        return _learning_kernels
+    return load_uncompiled(_learning_kernels)
+
+
+def test_consolidate_patterns_matches_numpy_fallback(kernels):
+    rng = np.random.default_rng(0)
+    conf = rng.uniform(0.5, 1.0, 200)
+    support = rng.integers(0, 8, 200)
+    contradictions = rng.integers(0, 6, 200)
+
+    kernel_conf, fallback_conf = conf.copy(), conf.copy()
+    kernel_masks = kernels.consolidate_patterns(kernel_conf, support, contradictions, 3, 2)
+    fallback_masks = _learning_kernels._consolidate_patterns_numpy(fallback_conf, support, contradictions, 3, 2)
+
+    np.testing.assert_allclose(kernel_conf, fallback_conf)
+    assert kernel_conf.max() <= 1.0
+    for kernel_mask, fallback_mask in zip(kernel_masks, fallback_masks):
+        np.testing.assert_array_equal(kernel_mask, fallback_mask)
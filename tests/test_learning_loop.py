@@ -0,0 +1,127 @@
+"""Tests for the adaptive learning loop"""
+
+import asyncio
+
+import pytest
+
+from unified_agentos.learning_loop import LearningExperience, LearningLoop, LearningType
+from unified_agentos.memory_interface import MemoryItem, MemoryType, UnifiedMemoryInterface
+from unified_agentos.message_bus import UnifiedMessageBus
+
+
+def make_loop() -> LearningLoop:
+    return LearningLoop(UnifiedMemoryInterface({}), UnifiedMessageBus(), None)
+
+
+def make_experience(experience_id: str, agent_id: str = "agent1") -> LearningExperience:
+    return LearningExperience(
+        experience_id=experience_id,
+        agent_id=agent_id,
+        learning_type=LearningType.EXPERIENTIAL,
+        context={"task": "deploy"},
+        action_taken="run_tests",
+        outcome={"ok": True},
+        success_score=0.9,
+    )
+
+
+async def drain(loop: LearningLoop, agent_id: str = "agent1"):
+    while loop.pending_experiences[agent_id]:
+        await loop._process_pending_experiences(agent_id)
+
+
+def test_repeated_experiences_reinforce_patterns():
+    async def run():
+        loop = make_loop()
+        for i in range(4):
+            assert await loop.add_learning_experience(make_experience(f"e{i}"))
+        await drain(loop)
+        return loop
+
+    loop = asyncio.run(run())
+    state = loop.agent_states["agent1"]
+    assert state.total_learning_events == 4
+    assert len(loop.learning_histories["agent1"]) == 4
+    [pattern] = state.learned_patterns.values()
+    assert pattern.support_count == 4
+
+
+def test_resubmitted_experience_is_dropped():
+    async def run():
+        loop = make_loop()
+        for _ in range(3):
+            assert await loop.add_learning_experience(make_experience("e0"))
+        assert await loop.add_learning_experiences([make_experience("e0"), make_experience("e1")]) == [True, True]
+        await drain(loop)
+        return loop
+
+    loop = asyncio.run(run())
+    assert loop.agent_states["agent1"].total_learning_events == 2
+    assert len(loop.learning_histories["agent1"]) == 2
+
+
+def test_stop_writes_queued_knowledge_memories():
+    async def run():
+        memory = UnifiedMemoryInterface({})
+        loop = LearningLoop(memory, UnifiedMessageBus(), None)
+        await loop.start()
+        store_queue = loop._get_store_queue()
+        for i in range(3):
+            await store_queue.put(MemoryItem(
+                memory_id=f"knowledge_{i}",
+                agent_id="store_agent",
+                memory_type=MemoryType.SEMANTIC,
+                content=f"fact {i}",
+            ))
+        # Let the flusher pick up the first item and start waiting for the rest
+        await asyncio.sleep(0)
+        await loop.stop()
+        return memory
+
+    memory = asyncio.run(run())
+    assert len(memory._agent_memories["store_agent"]) == 3
+
+
+def test_fusion_keeps_merged_conditions():
+    async def run():
+        loop = make_loop()
+        for i in range(3):
+            experience = make_experience(f"e{i}")
+            experience.context = {"task": f"deploy-{i}"}
+            await loop.add_learning_experience(experience)
+        await drain(loop)
+        await loop._consolidate_knowledge("agent1")
+        state = loop.agent_states["agent1"]
+        fused = list(state.learned_patterns.values())
+        
+        # A later experience under a merged condition reinforces the fused pattern
+        repeat = make_experience("e3")
+        repeat.context = {"task": "deploy-0"}
+        await loop.add_learning_experience(repeat)
+        await drain(loop)
+        return state, fused
+
+    state, fused = asyncio.run(run())
+    [primary] = fused
+    assert len(state.learned_patterns) == 1
+    assert len(primary.metadata["merged_conditions"]) == 2
+    assert primary.support_count == 4
+
+
+def test_registered_strategy_replaces_dispatch():
+    seen = []
+
+    async def strategy(experience):
+        seen.append(experience.experience_id)
+        return {}
+
+    async def run():
+        loop = make_loop()
+        with pytest.raises(TypeError):
+            loop.learning_strategies[LearningType.EXPERIENTIAL] = strategy
+        loop.register_learning_strategy(LearningType.EXPERIENTIAL, strategy)
+        await loop.add_learning_experience(make_experience("e0", agent_id="strategy_agent"))
+        await drain(loop, "strategy_agent")
+
+    asyncio.run(run())
+    assert seen == ["e0"]
@@ -72,6 +72,7 @@ from .cognitive_engine import (
     CognitiveEngine,
     CognitiveProcessType,
     CognitiveState,
+    AttentionWeights,
     CognitiveContext,
     CognitiveProcess,
     CognitiveResult,
@@ -116,6 +117,7 @@ from .enhanced_ail_processor import (
     AILProcessingResult,
     get_enhanced_ail_processor,
     send_cognitive_request,
+    send_cognitive_requests,
     share_knowledge
 )
 
@@ -162,6 +164,7 @@ __all__ = [
     "CognitiveEngine",
     "CognitiveProcessType",
     "CognitiveState",
+    "AttentionWeights",
     "CognitiveContext",
     "CognitiveProcess",
     "CognitiveResult",
@@ -203,5 +206,6 @@ __all__ = [
     "AILProcessingResult",
     "get_enhanced_ail_processor",
     "send_cognitive_request",
+    "send_cognitive_requests",
     "share_knowledge"
 ]
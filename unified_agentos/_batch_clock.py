@@ -0,0 +1,76 @@
+"""
+Batch Clock
+===========
+
+Wall-clock reading shared by everything processed in one batch.
+
+A batch reads the clock once when it starts and the timestamps and ids
+taken inside it reuse that reading. The reading lives in a context
+variable, so concurrent batches running in different tasks never see each
+other's clock, and it expires when the batch ends; outside a batch the
+live clock is read.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from itertools import count
+from typing import Iterator, Optional
+
+
+class _Reading:
+    """One clock reading, valid until its batch ends"""
+    
+    __slots__ = ('now', 'now_iso', 'stamp_prefix', 'active')
+    
+    def __init__(self):
+        self.now = datetime.now(timezone.utc)
+        self.now_iso = self.now.isoformat()
+        self.stamp_prefix = f"{int(self.now.timestamp() * 1000)}_"  # formatted once per batch
+        self.active = True
+
+
+class BatchClock:
+    """
+    Per-batch clock for a processing loop.
+    
+    Create one per module at import time, since context variables are never
+    released.
+    """
+    
+    def __init__(self, name: str):
+        self._current: "ContextVar[Optional[_Reading]]" = ContextVar(name, default=None)
+        self._counter = count(1)
+    
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Read the clock once for the batch processed inside this block"""
+        reading = _Reading()
+        token = self._current.set(reading)
+        try:
+            yield
+        finally:
+            # Tasks started inside the batch inherit the context; expire it for them too
+            reading.active = False
+            self._current.reset(token)
+    
+    def _reading(self) -> Optional[_Reading]:
+        reading = self._current.get()
+        return reading if reading is not None and reading.active else None
+    
+    def now(self) -> datetime:
+        """Current batch time, or the live clock outside a batch"""
+        reading = self._reading()
+        return reading.now if reading is not None else datetime.now(timezone.utc)
+    
+    def now_iso(self) -> str:
+        """ISO-8601 form of ``now()``"""
+        reading = self._reading()
+        return reading.now_iso if reading is not None else datetime.now(timezone.utc).isoformat()
+    
+    def next_stamp(self) -> str:
+        """Unique time stamp for ids: clock milliseconds plus a running counter"""
+        reading = self._reading()
+        prefix = reading.stamp_prefix if reading is not None else f"{int(time.time() * 1000)}_"
+        return f"{prefix}{next(self._counter)}"
@@ -0,0 +1,43 @@
+"""
+Cognitive Kernels
+=================
+
+Numeric helpers used on the cognitive engine's statistics paths.
+
+When Numba is installed the kernels are JIT-compiled (and cached on disk);
+otherwise an equivalent NumPy implementation is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _avg_and_diversity_numpy(conf: np.ndarray, types: np.ndarray, n: int):
+    """Mean of the first ``n`` confidences and number of distinct types"""
+    if n == 0:
+        return 0.0, 0
+    return float(conf[:n].mean()), int(np.unique(types[:n]).size)
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def avg_and_diversity(conf, types, n):
+        """Mean of the first ``n`` confidences and number of distinct types"""
+        if n == 0:
+            return 0.0, 0
+        seen = np.zeros(256, dtype=np.bool_)
+        total = 0.0
+        distinct = 0
+        for i in range(n):
+            total += conf[i]
+            t = types[i]
+            if not seen[t]:
+                seen[t] = True
+                distinct += 1
+        return total / n, distinct
+else:
+    avg_and_diversity = _avg_and_diversity_numpy
@@ -0,0 +1,9 @@
+"""
+Compatibility helpers for the supported Python versions.
+"""
+
+import sys
+
+# ``@dataclass(slots=True)`` is only available from Python 3.10; on older
+# interpreters the dataclasses keep a regular instance ``__dict__``.
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
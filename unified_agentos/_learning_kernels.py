@@ -0,0 +1,49 @@
+"""
+Learning Kernels
+================
+
+Numeric helpers used on the learning loop's consolidation path.
+
+When Numba is installed the kernels are JIT-compiled (and cached on disk);
+otherwise an equivalent NumPy implementation is used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _consolidate_patterns_numpy(conf: np.ndarray, support: np.ndarray, contradictions: np.ndarray,
+                                min_support: int, max_contradictions: int):
+    """
+    Strengthen well-supported pattern confidences in place, capped at 1.0.
+    Returns masks of the strengthened patterns and of the contradicted ones.
+    """
+    strengthened = support >= min_support
+    conf[strengthened] = np.minimum(conf[strengthened] * 1.05, 1.0)
+    return strengthened, contradictions > max_contradictions
+
+
+if njit is not None:
+    @njit(cache=True)
+    def consolidate_patterns(conf, support, contradictions, min_support, max_contradictions):
+        """
+        Strengthen well-supported pattern confidences in place, capped at 1.0.
+        Returns masks of the strengthened patterns and of the contradicted ones.
+        """
+        n = conf.shape[0]
+        strengthened = np.zeros(n, dtype=np.bool_)
+        contradicted = np.zeros(n, dtype=np.bool_)
+        for i in range(n):
+            if support[i] >= min_support:
+                c = conf[i] * 1.05
+                conf[i] = c if c < 1.0 else 1.0
+                strengthened[i] = True
+            if contradictions[i] > max_contradictions:
+                contradicted[i] = True
+        return strengthened, contradicted
+else:
+    consolidate_patterns = _consolidate_patterns_numpy
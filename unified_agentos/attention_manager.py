@@ -250,6 +250,47 @@ class AttentionManager:
             self.logger.error(f"Error setting primary focus for {agent_id}: {e}")
             return False
     
+    async def set_primary_focus_bulk(self, agent_id: str, targets: List[AttentionTarget]) -> List[bool]:
+        """Set several primary focuses for an agent in order; the last one ends up focused"""
+        if not targets:
+            return []
+        try:
+            await self.register_agent(agent_id)
+            
+            state = self.agent_states[agent_id]
+            context = self.attention_contexts[agent_id]
+            history = self.attention_histories[agent_id]
+            now = datetime.now(timezone.utc)
+            timestamp = now.isoformat()
+            
+            for target in targets:
+                # Store previous focus in history
+                if state.primary_focus:
+                    history.append({
+                        'action': 'focus_shift',
+                        'from': state.primary_focus.target_id,
+                        'to': target.target_id,
+                        'timestamp': timestamp
+                    })
+                state.primary_focus = target
+                self.attention_targets[agent_id].append(target)
+            
+            state.last_shift = now
+            state.shift_count += len(targets)
+            state.focus_state = FocusState.SHARP
+            state.attention_type = AttentionType.FOCUSED
+            
+            # Update context
+            context.current_task = targets[-1].target_id
+            context.focus_targets = [targets[-1]]
+            
+            self.logger.info(f"Set primary focus for {agent_id}: {targets[-1].target_id} ({len(targets)} updates)")
+            return [True] * len(targets)
+            
+        except Exception as e:
+            self.logger.error(f"Error setting primary focus for {agent_id}: {e}")
+            return [False] * len(targets)
+    
     async def add_secondary_focus(self, agent_id: str, target: AttentionTarget) -> bool:
         """Add secondary focus for an agent"""
         try:
@@ -16,13 +16,28 @@ Key Features:
 
 import asyncio
 import logging
+import re
+import sys
+import threading
 import time
-from typing import Dict, List, Optional, Any, Callable, Set, Tuple
+from collections import Counter, defaultdict, deque
+from itertools import islice
+from statistics import fmean
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple, NamedTuple, Deque, Iterator
 from dataclasses import dataclass, field
 from enum import Enum
 import json
 from datetime import datetime, timezone
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ._cognitive_kernels import avg_and_diversity
+from ._compat import DATACLASS_SLOTS
 from .memory_interface import UnifiedMemoryInterface, MemoryType, MemoryItem, MemoryQuery
 from .message_bus import UnifiedMessageBus, Message, MessageType, MessagePriority
 
@@ -39,6 +54,24 @@ class CognitiveProcessType(Enum):
     EVALUATION = "evaluation"
 
 
+# Small integer codes for process types, used by the numeric kernels
+_PROCESS_TYPE_CODES: Dict[CognitiveProcessType, int] = {t: i for i, t in enumerate(CognitiveProcessType)}
+
+# Compact JSON encoding for stored results; orjson is used when installed
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'), default=str)
+
+# Interned string values of process types, resolved once at import
+_TYPE_VALUES: Dict[CognitiveProcessType, str] = {t: sys.intern(t.value) for t in CognitiveProcessType}
+
+# Whitespace-delimited words longer than four characters (concept candidates)
+_CONCEPT_WORD_RE = re.compile(r'\S{5,}')
+
+
 class CognitiveState(Enum):
     """Current cognitive state of the agent"""
     IDLE = "idle"
@@ -50,7 +83,16 @@ class CognitiveState(Enum):
     EXECUTING = "executing"
 
 
-@dataclass
+class AttentionWeights(NamedTuple):
+    """Attention weights for the different aspects of a cognitive context"""
+    current_task: float = 1.0
+    recent_memory: float = 0.8
+    long_term_memory: float = 0.6
+    social_context: float = 0.7
+    emotional_context: float = 0.5
+
+
+@dataclass(**DATACLASS_SLOTS)
 class CognitiveContext:
     """Context for cognitive processing"""
     agent_id: str
@@ -58,13 +100,13 @@ class CognitiveContext:
     task_context: Dict[str, Any] = field(default_factory=dict)
     relevant_memories: List[MemoryItem] = field(default_factory=list)
     current_focus: Optional[str] = None
-    attention_weights: Dict[str, float] = field(default_factory=dict)
+    attention_weights: AttentionWeights = field(default_factory=AttentionWeights)
     cognitive_load: float = 0.0
     processing_depth: int = 1
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CognitiveProcess:
     """Represents a cognitive process"""
     process_id: str
@@ -80,7 +122,7 @@ class CognitiveProcess:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class CognitiveResult:
     """Result of cognitive processing"""
     process_id: str
@@ -93,6 +135,27 @@ class CognitiveResult:
     next_actions: List[str] = field(default_factory=list)
     learned_concepts: List[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    _result_data_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _timestamp_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    result_type_value: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Shared interned string so stats keys and memory metadata reuse one object
+        self.result_type_value = _TYPE_VALUES[self.result_type]
+    
+    @property
+    def result_data_json(self) -> str:
+        """JSON serialization of result_data, computed once and reused"""
+        if self._result_data_json is None:
+            self._result_data_json = _dumps(self.result_data)
+        return self._result_data_json
+    
+    @property
+    def timestamp_iso(self) -> str:
+        """ISO-8601 form of timestamp, computed once and reused"""
+        if self._timestamp_iso is None:
+            self._timestamp_iso = self.timestamp.isoformat()
+        return self._timestamp_iso
 
 
 class CognitiveEngine:
@@ -111,7 +174,23 @@ class CognitiveEngine:
         # Cognitive state tracking
         self.agent_states: Dict[str, CognitiveState] = {}
         self.active_processes: Dict[str, CognitiveProcess] = {}
-        self.cognitive_histories: Dict[str, List[CognitiveResult]] = {}
+        self._active_by_agent: Dict[str, int] = defaultdict(int)
+        self.history_cap = 1000  # results kept per agent
+        self.reflection_window = 5  # results averaged by the reflection trigger
+        self.cognitive_histories: Dict[str, Deque[CognitiveResult]] = defaultdict(
+            lambda: deque(maxlen=self.history_cap)
+        )
+        
+        # Running per-agent statistics, updated as results are recorded
+        self.agent_stats: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {'count': 0, 'conf_sum': 0.0, 'types': Counter()}
+        )
+        self._recent_conf: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.reflection_window))
+        self._recent_conf_sum: Dict[str, float] = defaultdict(float)
+        self._since_metacog: Dict[str, int] = defaultdict(int)
+        # Rolling distinct-count of the last few result types (learning trigger)
+        self._recent_types: Dict[str, Deque[CognitiveProcessType]] = defaultdict(lambda: deque(maxlen=3))
+        self._recent_type_counts: Dict[str, Counter] = defaultdict(Counter)
         
         # Processing handlers
         self.process_handlers: Dict[CognitiveProcessType, Callable] = {}
@@ -122,10 +201,24 @@ class CognitiveEngine:
         self.cognitive_loop_interval = 5.0  # seconds
         self.reflection_threshold = 0.7
         self.learning_threshold = 0.6
+        self.metacognition_interval = 10  # results between metacognitive reviews
         
         # Background cognitive loop
         self._cognitive_loop_task = None
         self._running = False
+        
+        # Detached trigger checks, at most one running per agent
+        self._bg_tasks: Set[asyncio.Task] = set()
+        self._trigger_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        
+        # Minimum seconds between two firings of the same trigger for an agent
+        self._cooldowns = {'reflection': 30.0, 'learning': 60.0, 'metacog': 120.0}
+        self._last_fire: Dict[Tuple[str, str], float] = {}
+        
+        # Short-lived caches for polled getters, dropped whenever the agent changes
+        self.read_cache_ttl = 1.0  # seconds
+        self._stats_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._history_cache: Dict[str, Dict[int, Tuple[float, Tuple[CognitiveResult, ...]]]] = {}
     
     def _register_default_handlers(self):
         """Register default cognitive process handlers"""
@@ -158,6 +251,8 @@ class CognitiveEngine:
                 await self._cognitive_loop_task
             except asyncio.CancelledError:
                 pass
+        for task in list(self._bg_tasks):
+            task.cancel()
         self.logger.info("Cognitive engine stopped")
     
     async def _cognitive_loop(self):
@@ -172,35 +267,38 @@ class CognitiveEngine:
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.error(f"Error in cognitive loop: {e}")
+                self.logger.error("Error in cognitive loop: %s", e)
                 await asyncio.sleep(1.0)
     
     async def _process_cognitive_maintenance(self, agent_id: str):
         """Process cognitive maintenance for an agent"""
         try:
             # Check if agent needs reflection
-            await self._check_reflection_trigger(agent_id)
+            self._spawn_trigger(self._check_reflection_trigger(agent_id))
             
             # Check if agent needs learning
-            await self._check_learning_trigger(agent_id)
-            
-            # Process metacognition
-            await self._check_metacognition_trigger(agent_id)
+            self._spawn_trigger(self._check_learning_trigger(agent_id))
             
         except Exception as e:
-            self.logger.error(f"Error in cognitive maintenance for {agent_id}: {e}")
+            self.logger.error("Error in cognitive maintenance for %s: %s", agent_id, e)
     
     async def process_cognitive_request(self, agent_id: str, process_type: CognitiveProcessType, 
                                        input_data: Dict[str, Any], context: Optional[CognitiveContext] = None) -> CognitiveResult:
         """Process a cognitive request"""
+        process = None
         try:
+            # Resolve the handler first so unknown types fail before any context work
+            handler = self.process_handlers.get(process_type)
+            if handler is None:
+                raise ValueError(f"No handler for process type: {process_type}")
+            
             # Create cognitive context if not provided
             if context is None:
                 context = await self._create_cognitive_context(agent_id, input_data)
             
             # Create cognitive process
             process = CognitiveProcess(
-                process_id=f"{agent_id}_{process_type.value}_{int(time.time() * 1000)}",
+                process_id=f"{agent_id}_{_TYPE_VALUES[process_type]}_{int(time.time() * 1000)}",
                 process_type=process_type,
                 agent_id=agent_id,
                 context=context,
@@ -211,12 +309,10 @@ class CognitiveEngine:
             # Update agent state
             self.agent_states[agent_id] = CognitiveState.PROCESSING
             self.active_processes[process.process_id] = process
+            self._active_by_agent[agent_id] += 1
+            self._stats_cache.pop(agent_id, None)
             
             # Process the request
-            handler = self.process_handlers.get(process_type)
-            if not handler:
-                raise ValueError(f"No handler for process type: {process_type}")
-            
             result = await handler(process)
             
             # Update process status
@@ -224,27 +320,77 @@ class CognitiveEngine:
             process.status = "completed"
             
             # Store cognitive history
-            if agent_id not in self.cognitive_histories:
-                self.cognitive_histories[agent_id] = []
-            self.cognitive_histories[agent_id].append(result)
+            self._record_result(agent_id, result)
             
             # Update memory with cognitive results
             await self._store_cognitive_memory(result)
             
             # Clean up
             del self.active_processes[process.process_id]
+            self._active_by_agent[agent_id] -= 1
             self.agent_states[agent_id] = CognitiveState.IDLE
+            self._stats_cache.pop(agent_id, None)
+            
+            # Periodic metacognitive review
+            self._spawn_trigger(self._check_metacognition_trigger(agent_id))
             
             return result
             
         except Exception as e:
-            self.logger.error(f"Error processing cognitive request for {agent_id}: {e}")
+            self.logger.error("Error in %s process for %s: %s", process_type.value, agent_id, e)
             # Clean up on error
-            if process.process_id in self.active_processes:
-                del self.active_processes[process.process_id]
+            if process is not None:
+                process.status = "failed"
+                process.error = str(e)
+                if self.active_processes.pop(process.process_id, None) is not None:
+                    self._active_by_agent[agent_id] -= 1
             self.agent_states[agent_id] = CognitiveState.IDLE
+            self._stats_cache.pop(agent_id, None)
             raise
     
+    def _record_result(self, agent_id: str, result: CognitiveResult):
+        """Append a result to the agent's history and update running statistics"""
+        self.cognitive_histories[agent_id].append(result)
+        self._stats_cache.pop(agent_id, None)
+        self._history_cache.pop(agent_id, None)
+        
+        stats = self.agent_stats[agent_id]
+        stats['count'] += 1
+        stats['conf_sum'] += result.confidence
+        stats['types'][result.result_type_value] += 1
+        self._since_metacog[agent_id] += 1
+        
+        # Keep a running sum over the reflection window
+        window = self._recent_conf[agent_id]
+        if len(window) == window.maxlen:
+            self._recent_conf_sum[agent_id] -= window[0]
+        window.append(result.confidence)
+        self._recent_conf_sum[agent_id] += result.confidence
+        
+        # Keep the distinct-type count over the learning window
+        types = self._recent_types[agent_id]
+        counts = self._recent_type_counts[agent_id]
+        if len(types) == types.maxlen:
+            old = types[0]
+            counts[old] -= 1
+            if counts[old] == 0:
+                del counts[old]
+        types.append(result.result_type)
+        counts[result.result_type] += 1
+    
+    def _iter_recent(self, agent_id: str, limit: int) -> Iterator[CognitiveResult]:
+        """Iterate over the last ``limit`` results for an agent, newest first"""
+        history = self.cognitive_histories.get(agent_id)
+        if not history:
+            return iter(())
+        return islice(reversed(history), limit)
+    
+    def _recent_results(self, agent_id: str, limit: int) -> List[CognitiveResult]:
+        """Get the last ``limit`` results for an agent, oldest first"""
+        recent = list(self._iter_recent(agent_id, limit))
+        recent.reverse()
+        return recent
+    
     async def _create_cognitive_context(self, agent_id: str, input_data: Dict[str, Any]) -> CognitiveContext:
         """Create cognitive context for processing"""
         # Retrieve relevant memories
@@ -284,532 +430,521 @@ class CognitiveEngine:
             return memories
             
         except Exception as e:
-            self.logger.error(f"Error retrieving relevant memories: {e}")
+            self.logger.error("Error retrieving relevant memories: %s", e)
             return []
     
     async def _calculate_attention_weights(self, agent_id: str, input_data: Dict[str, Any], 
-                                         memories: List[MemoryItem]) -> Dict[str, float]:
+                                         memories: List[MemoryItem]) -> AttentionWeights:
         """Calculate attention weights for different aspects"""
-        weights = {
-            'current_task': 1.0,
-            'recent_memory': 0.8,
-            'long_term_memory': 0.6,
-            'social_context': 0.7,
-            'emotional_context': 0.5
-        }
+        weights = AttentionWeights()
         
         # Adjust weights based on context
         if memories:
-            weights['recent_memory'] = min(1.0, weights['recent_memory'] + len(memories) * 0.1)
+            weights = weights._replace(recent_memory=min(1.0, weights.recent_memory + len(memories) * 0.1))
         
         return weights
     
     async def _process_reasoning(self, process: CognitiveProcess) -> CognitiveResult:
         """Process reasoning request"""
-        try:
-            input_data = process.input_data
-            context = process.context
-            
-            reasoning_trace = []
-            result_data = {}
-            
-            # Step 1: Analyze the problem/question
-            problem = input_data.get('problem', input_data.get('query', ''))
-            reasoning_trace.append(f"Analyzing problem: {problem}")
-            
-            # Step 2: Integrate relevant memories
-            if context.relevant_memories:
-                reasoning_trace.append(f"Integrating {len(context.relevant_memories)} relevant memories")
-                memory_insights = []
-                for memory in context.relevant_memories:
-                    if hasattr(memory, 'content') and memory.content:
-                        memory_insights.append(memory.content[:200])
-                result_data['memory_insights'] = memory_insights
-            
-            # Step 3: Apply reasoning patterns
-            reasoning_patterns = [
-                "analytical_reasoning",
-                "analogical_reasoning", 
-                "causal_reasoning",
-                "deductive_reasoning",
-                "inductive_reasoning"
-            ]
-            
-            reasoning_trace.append("Applying reasoning patterns:")
-            for pattern in reasoning_patterns:
-                reasoning_trace.append(f"  - {pattern}")
-            
-            # Step 4: Generate conclusions
-            conclusions = []
-            if problem:
-                # Simple reasoning simulation - in real implementation, this would use LLM
-                if "why" in problem.lower():
-                    conclusions.append("Causal analysis suggests multiple factors")
-                elif "how" in problem.lower():
-                    conclusions.append("Process analysis indicates step-by-step approach")
-                elif "what" in problem.lower():
-                    conclusions.append("Definitional analysis provides clarity")
-                else:
-                    conclusions.append("General analysis yields insights")
-            
-            result_data['conclusions'] = conclusions
-            reasoning_trace.append(f"Generated {len(conclusions)} conclusions")
-            
-            return CognitiveResult(
-                process_id=process.process_id,
-                agent_id=process.agent_id,
-                result_type=CognitiveProcessType.REASONING,
-                result_data=result_data,
-                confidence=0.8,
-                reasoning_trace=reasoning_trace,
-                memory_updates=[],
-                next_actions=["store_reasoning_result", "evaluate_conclusions"]
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error in reasoning process: {e}")
-            raise
+        input_data = process.input_data
+        context = process.context
+        
+        reasoning_trace = []
+        result_data = {}
+        
+        # Step 1: Analyze the problem/question
+        problem = input_data.get('problem', input_data.get('query', ''))
+        reasoning_trace.append(f"Analyzing problem: {problem}")
+        
+        # Step 2: Integrate relevant memories
+        if context.relevant_memories:
+            reasoning_trace.append(f"Integrating {len(context.relevant_memories)} relevant memories")
+            memory_insights = []
+            for memory in context.relevant_memories:
+                if hasattr(memory, 'content') and memory.content:
+                    memory_insights.append(memory.content[:200])
+            result_data['memory_insights'] = memory_insights
+        
+        # Step 3: Apply reasoning patterns
+        reasoning_patterns = [
+            "analytical_reasoning",
+            "analogical_reasoning", 
+            "causal_reasoning",
+            "deductive_reasoning",
+            "inductive_reasoning"
+        ]
+        
+        reasoning_trace.append("Applying reasoning patterns:")
+        for pattern in reasoning_patterns:
+            reasoning_trace.append(f"  - {pattern}")
+        
+        # Step 4: Generate conclusions
+        conclusions = []
+        if problem:
+            # Simple reasoning simulation - in real implementation, this would use LLM
+            if "why" in problem.lower():
+                conclusions.append("Causal analysis suggests multiple factors")
+            elif "how" in problem.lower():
+                conclusions.append("Process analysis indicates step-by-step approach")
+            elif "what" in problem.lower():
+                conclusions.append("Definitional analysis provides clarity")
+            else:
+                conclusions.append("General analysis yields insights")
+        
+        result_data['conclusions'] = conclusions
+        reasoning_trace.append(f"Generated {len(conclusions)} conclusions")
+        
+        return CognitiveResult(
+            process_id=process.process_id,
+            agent_id=process.agent_id,
+            result_type=CognitiveProcessType.REASONING,
+            result_data=result_data,
+            confidence=0.8,
+            reasoning_trace=reasoning_trace,
+            memory_updates=[],
+            next_actions=["store_reasoning_result", "evaluate_conclusions"]
+        )
     
     async def _process_decision_making(self, process: CognitiveProcess) -> CognitiveResult:
         """Process decision making request"""
-        try:
-            input_data = process.input_data
-            context = process.context
-            
-            reasoning_trace = []
-            result_data = {}
-            
-            # Extract decision parameters
-            options = input_data.get('options', [])
-            criteria = input_data.get('criteria', [])
-            
-            reasoning_trace.append(f"Evaluating {len(options)} options against {len(criteria)} criteria")
-            
-            # Simple decision matrix - in real implementation, this would be more sophisticated
-            decision_scores = {}
-            for option in options:
-                score = 0.5  # Base score
-                # Adjust based on memory relevance
-                if context.relevant_memories:
-                    score += 0.2
-                decision_scores[option] = score
-            
-            # Select best option
-            if decision_scores:
-                best_option = max(decision_scores.keys(), key=lambda x: decision_scores[x])
-                result_data['selected_option'] = best_option
-                result_data['decision_scores'] = decision_scores
-                reasoning_trace.append(f"Selected option: {best_option}")
-            
-            return CognitiveResult(
-                process_id=process.process_id,
-                agent_id=process.agent_id,
-                result_type=CognitiveProcessType.DECISION_MAKING,
-                result_data=result_data,
-                confidence=0.7,
-                reasoning_trace=reasoning_trace,
-                next_actions=["implement_decision", "monitor_outcomes"]
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error in decision making process: {e}")
-            raise
+        input_data = process.input_data
+        context = process.context
+        
+        reasoning_trace = []
+        result_data = {}
+        
+        # Extract decision parameters
+        options = input_data.get('options', [])
+        criteria = input_data.get('criteria', [])
+        
+        reasoning_trace.append(f"Evaluating {len(options)} options against {len(criteria)} criteria")
+        
+        # Simple decision matrix - in real implementation, this would be more sophisticated
+        decision_scores = {}
+        best_option = None
+        best_score = float('-inf')
+        for option in options:
+            score = 0.5  # Base score
+            # Adjust based on memory relevance
+            if context.relevant_memories:
+                score += 0.2
+            decision_scores[option] = score
+            # Track the best option as scores are built
+            if score > best_score:
+                best_option, best_score = option, score
+        
+        # Select best option
+        if decision_scores:
+            result_data['selected_option'] = best_option
+            result_data['decision_scores'] = decision_scores
+            reasoning_trace.append(f"Selected option: {best_option}")
+        
+        return CognitiveResult(
+            process_id=process.process_id,
+            agent_id=process.agent_id,
+            result_type=CognitiveProcessType.DECISION_MAKING,
+            result_data=result_data,
+            confidence=0.7,
+            reasoning_trace=reasoning_trace,
+            next_actions=["implement_decision", "monitor_outcomes"]
+        )
     
     async def _process_reflection(self, process: CognitiveProcess) -> CognitiveResult:
         """Process reflection request"""
-        try:
-            agent_id = process.agent_id
-            reasoning_trace = []
-            result_data = {}
-            
-            # Get recent cognitive history
-            recent_history = self.cognitive_histories.get(agent_id, [])[-10:]  # Last 10 results
-            reasoning_trace.append(f"Reflecting on {len(recent_history)} recent cognitive activities")
-            
-            # Analyze patterns
-            process_types = [r.result_type.value for r in recent_history]
-            most_common = max(set(process_types), key=process_types.count) if process_types else "none"
-            
-            # Generate insights
-            insights = []
-            if recent_history:
-                avg_confidence = sum(r.confidence for r in recent_history) / len(recent_history)
-                insights.append(f"Average confidence level: {avg_confidence:.2f}")
-                insights.append(f"Most frequent cognitive process: {most_common}")
-                
-                if avg_confidence < self.reflection_threshold:
-                    insights.append("Low confidence detected - may need more learning")
-            
-            result_data['insights'] = insights
-            result_data['patterns'] = {
-                'most_common_process': most_common,
-                'average_confidence': avg_confidence if recent_history else 0.0
-            }
-            
-            reasoning_trace.extend(insights)
-            
-            # Generate memory updates for reflective insights
-            memory_updates = []
-            if insights:
-                reflection_memory = MemoryItem(
-                    memory_id=f"reflection_{agent_id}_{int(time.time() * 1000)}",
-                    agent_id=agent_id,
-                    memory_type=MemoryType.EPISODIC,
-                    content=f"Reflection insights: {'; '.join(insights)}",
-                    metadata={'reflection_timestamp': datetime.now(timezone.utc).isoformat()}
-                )
-                memory_updates.append(reflection_memory)
-            
-            return CognitiveResult(
-                process_id=process.process_id,
+        agent_id = process.agent_id
+        reasoning_trace = []
+        result_data = {}
+        
+        # Get recent cognitive history
+        recent_history = self._recent_results(agent_id, 10)  # Last 10 results
+        reasoning_trace.append(f"Reflecting on {len(recent_history)} recent cognitive activities")
+        
+        # Analyze patterns
+        process_counts = Counter(r.result_type_value for r in recent_history)
+        most_common = process_counts.most_common(1)[0][0] if process_counts else "none"
+        
+        # Generate insights
+        insights = []
+        if recent_history:
+            avg_confidence = fmean(r.confidence for r in recent_history)
+            insights.append(f"Average confidence level: {avg_confidence:.2f}")
+            insights.append(f"Most frequent cognitive process: {most_common}")
+            
+            if avg_confidence < self.reflection_threshold:
+                insights.append("Low confidence detected - may need more learning")
+        
+        result_data['insights'] = insights
+        result_data['patterns'] = {
+            'most_common_process': most_common,
+            'average_confidence': avg_confidence if recent_history else 0.0
+        }
+        
+        reasoning_trace.extend(insights)
+        
+        # Generate memory updates for reflective insights
+        now = datetime.now(timezone.utc)
+        memory_updates = []
+        if insights:
+            reflection_memory = MemoryItem(
+                memory_id=f"reflection_{agent_id}_{int(now.timestamp() * 1000)}",
                 agent_id=agent_id,
-                result_type=CognitiveProcessType.REFLECTION,
-                result_data=result_data,
-                confidence=0.9,
-                reasoning_trace=reasoning_trace,
-                memory_updates=memory_updates,
-                next_actions=["apply_insights", "adjust_behavior"]
+                memory_type=MemoryType.EPISODIC,
+                content=f"Reflection insights: {'; '.join(insights)}",
+                metadata={'reflection_timestamp': now.isoformat()}
             )
-            
-        except Exception as e:
-            self.logger.error(f"Error in reflection process: {e}")
-            raise
+            memory_updates.append(reflection_memory)
+        
+        return CognitiveResult(
+            process_id=process.process_id,
+            agent_id=agent_id,
+            result_type=CognitiveProcessType.REFLECTION,
+            result_data=result_data,
+            confidence=0.9,
+            reasoning_trace=reasoning_trace,
+            memory_updates=memory_updates,
+            next_actions=["apply_insights", "adjust_behavior"],
+            timestamp=now
+        )
     
     async def _process_learning(self, process: CognitiveProcess) -> CognitiveResult:
         """Process learning request"""
-        try:
-            input_data = process.input_data
-            agent_id = process.agent_id
-            reasoning_trace = []
-            result_data = {}
-            
-            # Extract learning content
-            content = input_data.get('content', input_data.get('experience', ''))
-            learning_type = input_data.get('learning_type', 'experiential')
-            
-            reasoning_trace.append(f"Processing {learning_type} learning from content")
-            
-            # Extract concepts and patterns
-            learned_concepts = []
-            if content:
-                # Simple concept extraction - in real implementation, this would use NLP
-                words = content.lower().split()
-                important_words = [w for w in words if len(w) > 4][:5]
-                learned_concepts = important_words
-            
-            reasoning_trace.append(f"Extracted {len(learned_concepts)} concepts")
-            
-            # Create learning memory
-            memory_updates = []
-            if content:
-                learning_memory = MemoryItem(
-                    memory_id=f"learning_{agent_id}_{int(time.time() * 1000)}",
-                    agent_id=agent_id,
-                    memory_type=MemoryType.SEMANTIC,
-                    content=f"Learning: {content}",
-                    metadata={
-                        'learning_type': learning_type,
-                        'concepts': learned_concepts,
-                        'timestamp': datetime.now(timezone.utc).isoformat()
-                    }
-                )
-                memory_updates.append(learning_memory)
-            
-            result_data['learned_concepts'] = learned_concepts
-            result_data['learning_type'] = learning_type
-            
-            return CognitiveResult(
-                process_id=process.process_id,
+        input_data = process.input_data
+        agent_id = process.agent_id
+        reasoning_trace = []
+        result_data = {}
+        
+        # Extract learning content
+        content = input_data.get('content', input_data.get('experience', ''))
+        learning_type = input_data.get('learning_type', 'experiential')
+        
+        reasoning_trace.append(f"Processing {learning_type} learning from content")
+        
+        # Extract concepts and patterns
+        learned_concepts = []
+        if content:
+            # Simple concept extraction - in real implementation, this would use NLP
+            # Scan lazily and stop after five matches so long content is not split in full
+            learned_concepts = [m.group().lower() for m in islice(_CONCEPT_WORD_RE.finditer(content), 5)]
+        
+        reasoning_trace.append(f"Extracted {len(learned_concepts)} concepts")
+        
+        # Create learning memory
+        now = datetime.now(timezone.utc)
+        memory_updates = []
+        if content:
+            learning_memory = MemoryItem(
+                memory_id=f"learning_{agent_id}_{int(now.timestamp() * 1000)}",
                 agent_id=agent_id,
-                result_type=CognitiveProcessType.LEARNING,
-                result_data=result_data,
-                confidence=0.8,
-                reasoning_trace=reasoning_trace,
-                memory_updates=memory_updates,
-                learned_concepts=learned_concepts,
-                next_actions=["integrate_knowledge", "update_models"]
+                memory_type=MemoryType.SEMANTIC,
+                content=f"Learning: {content}",
+                metadata={
+                    'learning_type': learning_type,
+                    'concepts': learned_concepts,
+                    'timestamp': now.isoformat()
+                }
             )
-            
-        except Exception as e:
-            self.logger.error(f"Error in learning process: {e}")
-            raise
+            memory_updates.append(learning_memory)
+        
+        result_data['learned_concepts'] = learned_concepts
+        result_data['learning_type'] = learning_type
+        
+        return CognitiveResult(
+            process_id=process.process_id,
+            agent_id=agent_id,
+            result_type=CognitiveProcessType.LEARNING,
+            result_data=result_data,
+            confidence=0.8,
+            reasoning_trace=reasoning_trace,
+            memory_updates=memory_updates,
+            learned_concepts=learned_concepts,
+            next_actions=["integrate_knowledge", "update_models"],
+            timestamp=now
+        )
     
     async def _process_problem_solving(self, process: CognitiveProcess) -> CognitiveResult:
         """Process problem solving request"""
-        try:
-            input_data = process.input_data
-            reasoning_trace = []
-            result_data = {}
-            
-            problem = input_data.get('problem', '')
-            constraints = input_data.get('constraints', [])
-            
-            reasoning_trace.append(f"Solving problem with {len(constraints)} constraints")
-            
-            # Problem decomposition
-            sub_problems = []
-            if problem:
-                # Simple decomposition - split by logical connectors
-                parts = problem.replace(' and ', ' | ').replace(' or ', ' | ').split(' | ')
-                sub_problems = [p.strip() for p in parts if p.strip()]
-            
-            reasoning_trace.append(f"Decomposed into {len(sub_problems)} sub-problems")
-            
-            # Generate solution approaches
-            approaches = [
-                "analytical_approach",
-                "creative_approach", 
-                "systematic_approach",
-                "collaborative_approach"
-            ]
-            
-            result_data['sub_problems'] = sub_problems
-            result_data['solution_approaches'] = approaches
-            result_data['constraints'] = constraints
-            
-            return CognitiveResult(
-                process_id=process.process_id,
-                agent_id=process.agent_id,
-                result_type=CognitiveProcessType.PROBLEM_SOLVING,
-                result_data=result_data,
-                confidence=0.7,
-                reasoning_trace=reasoning_trace,
-                next_actions=["implement_solutions", "test_approaches", "evaluate_results"]
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error in problem solving process: {e}")
-            raise
+        input_data = process.input_data
+        reasoning_trace = []
+        result_data = {}
+        
+        problem = input_data.get('problem', '')
+        constraints = input_data.get('constraints', [])
+        
+        reasoning_trace.append(f"Solving problem with {len(constraints)} constraints")
+        
+        # Problem decomposition
+        sub_problems = []
+        if problem:
+            # Simple decomposition - split by logical connectors
+            parts = problem.replace(' and ', ' | ').replace(' or ', ' | ').split(' | ')
+            sub_problems = [p.strip() for p in parts if p.strip()]
+        
+        reasoning_trace.append(f"Decomposed into {len(sub_problems)} sub-problems")
+        
+        # Generate solution approaches
+        approaches = [
+            "analytical_approach",
+            "creative_approach", 
+            "systematic_approach",
+            "collaborative_approach"
+        ]
+        
+        result_data['sub_problems'] = sub_problems
+        result_data['solution_approaches'] = approaches
+        result_data['constraints'] = constraints
+        
+        return CognitiveResult(
+            process_id=process.process_id,
+            agent_id=process.agent_id,
+            result_type=CognitiveProcessType.PROBLEM_SOLVING,
+            result_data=result_data,
+            confidence=0.7,
+            reasoning_trace=reasoning_trace,
+            next_actions=["implement_solutions", "test_approaches", "evaluate_results"]
+        )
     
     async def _process_metacognition(self, process: CognitiveProcess) -> CognitiveResult:
         """Process metacognition request"""
-        try:
-            agent_id = process.agent_id
-            reasoning_trace = []
-            result_data = {}
-            
-            reasoning_trace.append("Analyzing cognitive processes and strategies")
-            
-            # Analyze cognitive performance
-            recent_results = self.cognitive_histories.get(agent_id, [])[-20:]  # Last 20 results
-            
-            performance_metrics = {}
-            if recent_results:
-                # Calculate performance metrics
-                avg_confidence = sum(r.confidence for r in recent_results) / len(recent_results)
-                process_diversity = len(set(r.result_type.value for r in recent_results))
-                
-                performance_metrics = {
-                    'average_confidence': avg_confidence,
-                    'process_diversity': process_diversity,
-                    'total_processes': len(recent_results)
-                }
-            
-            # Generate metacognitive insights
-            insights = []
-            if performance_metrics:
-                if performance_metrics['average_confidence'] > 0.8:
-                    insights.append("High confidence levels indicate good cognitive calibration")
-                elif performance_metrics['average_confidence'] < 0.5:
-                    insights.append("Low confidence suggests need for more diverse learning")
-                
-                if performance_metrics['process_diversity'] < 3:
-                    insights.append("Limited cognitive diversity - should explore more process types")
-            
-            result_data['performance_metrics'] = performance_metrics
-            result_data['metacognitive_insights'] = insights
-            
-            reasoning_trace.extend(insights)
-            
-            return CognitiveResult(
-                process_id=process.process_id,
-                agent_id=agent_id,
-                result_type=CognitiveProcessType.METACOGNITION,
-                result_data=result_data,
-                confidence=0.85,
-                reasoning_trace=reasoning_trace,
-                next_actions=["optimize_strategies", "adjust_parameters"]
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error in metacognition process: {e}")
-            raise
+        agent_id = process.agent_id
+        reasoning_trace = []
+        result_data = {}
+        
+        reasoning_trace.append("Analyzing cognitive processes and strategies")
+        
+        # Analyze cognitive performance
+        recent_results = self._recent_results(agent_id, 20)  # Last 20 results
+        
+        performance_metrics = {}
+        if recent_results:
+            # Calculate performance metrics
+            n = len(recent_results)
+            confidences = np.fromiter((r.confidence for r in recent_results), dtype=np.float64, count=n)
+            type_codes = np.fromiter((_PROCESS_TYPE_CODES[r.result_type] for r in recent_results),
+                                     dtype=np.uint8, count=n)
+            avg_confidence, process_diversity = avg_and_diversity(confidences, type_codes, n)
+            
+            performance_metrics = {
+                'average_confidence': avg_confidence,
+                'process_diversity': process_diversity,
+                'total_processes': len(recent_results)
+            }
+        
+        # Generate metacognitive insights
+        insights = []
+        if performance_metrics:
+            if performance_metrics['average_confidence'] > 0.8:
+                insights.append("High confidence levels indicate good cognitive calibration")
+            elif performance_metrics['average_confidence'] < 0.5:
+                insights.append("Low confidence suggests need for more diverse learning")
+            
+            if performance_metrics['process_diversity'] < 3:
+                insights.append("Limited cognitive diversity - should explore more process types")
+        
+        result_data['performance_metrics'] = performance_metrics
+        result_data['metacognitive_insights'] = insights
+        
+        reasoning_trace.extend(insights)
+        
+        return CognitiveResult(
+            process_id=process.process_id,
+            agent_id=agent_id,
+            result_type=CognitiveProcessType.METACOGNITION,
+            result_data=result_data,
+            confidence=0.85,
+            reasoning_trace=reasoning_trace,
+            next_actions=["optimize_strategies", "adjust_parameters"]
+        )
     
     async def _process_planning(self, process: CognitiveProcess) -> CognitiveResult:
         """Process planning request"""
-        try:
-            input_data = process.input_data
-            reasoning_trace = []
-            result_data = {}
-            
-            goal = input_data.get('goal', '')
-            resources = input_data.get('resources', [])
-            timeline = input_data.get('timeline', 'flexible')
-            
-            reasoning_trace.append(f"Planning for goal: {goal}")
-            reasoning_trace.append(f"Available resources: {len(resources)}")
-            
-            # Generate plan steps
-            plan_steps = []
-            if goal:
-                # Simple planning - break goal into phases
-                phases = ["analysis", "preparation", "execution", "evaluation"]
-                for i, phase in enumerate(phases, 1):
-                    plan_steps.append({
-                        'step': i,
-                        'phase': phase,
-                        'description': f"{phase.capitalize()} phase for: {goal}",
-                        'estimated_effort': 'medium'
-                    })
-            
-            result_data['plan_steps'] = plan_steps
-            result_data['goal'] = goal
-            result_data['timeline'] = timeline
-            
-            reasoning_trace.append(f"Generated plan with {len(plan_steps)} steps")
-            
-            return CognitiveResult(
-                process_id=process.process_id,
-                agent_id=process.agent_id,
-                result_type=CognitiveProcessType.PLANNING,
-                result_data=result_data,
-                confidence=0.75,
-                reasoning_trace=reasoning_trace,
-                next_actions=["begin_execution", "monitor_progress", "adapt_plan"]
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error in planning process: {e}")
-            raise
+        input_data = process.input_data
+        reasoning_trace = []
+        result_data = {}
+        
+        goal = input_data.get('goal', '')
+        resources = input_data.get('resources', [])
+        timeline = input_data.get('timeline', 'flexible')
+        
+        reasoning_trace.append(f"Planning for goal: {goal}")
+        reasoning_trace.append(f"Available resources: {len(resources)}")
+        
+        # Generate plan steps
+        plan_steps = []
+        if goal:
+            # Simple planning - break goal into phases
+            phases = ["analysis", "preparation", "execution", "evaluation"]
+            for i, phase in enumerate(phases, 1):
+                plan_steps.append({
+                    'step': i,
+                    'phase': phase,
+                    'description': f"{phase.capitalize()} phase for: {goal}",
+                    'estimated_effort': 'medium'
+                })
+        
+        result_data['plan_steps'] = plan_steps
+        result_data['goal'] = goal
+        result_data['timeline'] = timeline
+        
+        reasoning_trace.append(f"Generated plan with {len(plan_steps)} steps")
+        
+        return CognitiveResult(
+            process_id=process.process_id,
+            agent_id=process.agent_id,
+            result_type=CognitiveProcessType.PLANNING,
+            result_data=result_data,
+            confidence=0.75,
+            reasoning_trace=reasoning_trace,
+            next_actions=["begin_execution", "monitor_progress", "adapt_plan"]
+        )
     
     async def _process_evaluation(self, process: CognitiveProcess) -> CognitiveResult:
         """Process evaluation request"""
-        try:
-            input_data = process.input_data
-            reasoning_trace = []
-            result_data = {}
-            
-            subject = input_data.get('subject', '')
-            criteria = input_data.get('criteria', [])
-            evidence = input_data.get('evidence', [])
-            
-            reasoning_trace.append(f"Evaluating: {subject}")
-            reasoning_trace.append(f"Using {len(criteria)} criteria")
-            
-            # Perform evaluation
-            evaluation_scores = {}
-            for criterion in criteria:
-                # Simple scoring - in real implementation, this would be more sophisticated
-                score = 0.7  # Base score
-                if evidence:
-                    score += 0.2  # Bonus for having evidence
-                evaluation_scores[criterion] = score
-            
-            # Calculate overall score
-            overall_score = sum(evaluation_scores.values()) / len(evaluation_scores) if evaluation_scores else 0.0
-            
-            result_data['evaluation_scores'] = evaluation_scores
-            result_data['overall_score'] = overall_score
-            result_data['evidence_considered'] = evidence
-            
-            reasoning_trace.append(f"Overall evaluation score: {overall_score:.2f}")
-            
-            return CognitiveResult(
-                process_id=process.process_id,
-                agent_id=process.agent_id,
-                result_type=CognitiveProcessType.EVALUATION,
-                result_data=result_data,
-                confidence=0.8,
-                reasoning_trace=reasoning_trace,
-                next_actions=["document_evaluation", "communicate_results"]
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error in evaluation process: {e}")
-            raise
+        input_data = process.input_data
+        reasoning_trace = []
+        result_data = {}
+        
+        subject = input_data.get('subject', '')
+        criteria = input_data.get('criteria', [])
+        evidence = input_data.get('evidence', [])
+        
+        reasoning_trace.append(f"Evaluating: {subject}")
+        reasoning_trace.append(f"Using {len(criteria)} criteria")
+        
+        # Perform evaluation
+        evaluation_scores = {}
+        for criterion in criteria:
+            # Simple scoring - in real implementation, this would be more sophisticated
+            score = 0.7  # Base score
+            if evidence:
+                score += 0.2  # Bonus for having evidence
+            evaluation_scores[criterion] = score
+        
+        # Calculate overall score
+        overall_score = sum(evaluation_scores.values()) / len(evaluation_scores) if evaluation_scores else 0.0
+        
+        result_data['evaluation_scores'] = evaluation_scores
+        result_data['overall_score'] = overall_score
+        result_data['evidence_considered'] = evidence
+        
+        reasoning_trace.append(f"Overall evaluation score: {overall_score:.2f}")
+        
+        return CognitiveResult(
+            process_id=process.process_id,
+            agent_id=process.agent_id,
+            result_type=CognitiveProcessType.EVALUATION,
+            result_data=result_data,
+            confidence=0.8,
+            reasoning_trace=reasoning_trace,
+            next_actions=["document_evaluation", "communicate_results"]
+        )
+    
+    def _spawn_trigger(self, coro):
+        """Run a trigger check in the background, off the caller's path"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
     
     async def _check_reflection_trigger(self, agent_id: str):
         """Check if agent should trigger reflection"""
-        try:
-            recent_results = self.cognitive_histories.get(agent_id, [])[-5:]  # Last 5 results
-            
-            if len(recent_results) >= 5:
-                avg_confidence = sum(r.confidence for r in recent_results) / len(recent_results)
+        now = time.monotonic()
+        if now - self._last_fire.get((agent_id, 'reflection'), float('-inf')) < self._cooldowns['reflection']:
+            return
+        lock = self._trigger_locks[agent_id]
+        if lock.locked():
+            return
+        async with lock:
+            try:
+                window = self._recent_conf[agent_id]
                 
-                if avg_confidence < self.reflection_threshold:
-                    # Trigger reflection
-                    await self.process_cognitive_request(
-                        agent_id=agent_id,
-                        process_type=CognitiveProcessType.REFLECTION,
-                        input_data={'trigger': 'low_confidence', 'threshold': self.reflection_threshold}
-                    )
-        except Exception as e:
-            self.logger.error(f"Error checking reflection trigger for {agent_id}: {e}")
+                if len(window) == window.maxlen:
+                    avg_confidence = self._recent_conf_sum[agent_id] / len(window)
+                    
+                    if avg_confidence < self.reflection_threshold:
+                        # Trigger reflection
+                        self._last_fire[(agent_id, 'reflection')] = now
+                        await self.process_cognitive_request(
+                            agent_id=agent_id,
+                            process_type=CognitiveProcessType.REFLECTION,
+                            input_data={'trigger': 'low_confidence', 'threshold': self.reflection_threshold}
+                        )
+            except Exception as e:
+                self.logger.error("Error checking reflection trigger for %s: %s", agent_id, e)
     
     async def _check_learning_trigger(self, agent_id: str):
         """Check if agent should trigger learning"""
-        try:
-            recent_results = self.cognitive_histories.get(agent_id, [])
-            
-            # Check if agent has had varied experiences that could be learned from
-            if len(recent_results) >= 3:
-                process_types = [r.result_type for r in recent_results[-3:]]
-                if len(set(process_types)) >= 2:  # Diverse experiences
-                    # Trigger learning consolidation
-                    await self.process_cognitive_request(
-                        agent_id=agent_id,
-                        process_type=CognitiveProcessType.LEARNING,
-                        input_data={
-                            'content': 'Recent diverse cognitive experiences',
-                            'learning_type': 'experiential',
-                            'trigger': 'experience_diversity'
-                        }
-                    )
-        except Exception as e:
-            self.logger.error(f"Error checking learning trigger for {agent_id}: {e}")
+        now = time.monotonic()
+        if now - self._last_fire.get((agent_id, 'learning'), float('-inf')) < self._cooldowns['learning']:
+            return
+        lock = self._trigger_locks[agent_id]
+        if lock.locked():
+            return
+        async with lock:
+            try:
+                types = self._recent_types[agent_id]
+                
+                # Check if agent has had varied experiences that could be learned from
+                if len(types) == types.maxlen:
+                    if len(self._recent_type_counts[agent_id]) >= 2:  # Diverse experiences
+                        # Trigger learning consolidation
+                        self._last_fire[(agent_id, 'learning')] = now
+                        await self.process_cognitive_request(
+                            agent_id=agent_id,
+                            process_type=CognitiveProcessType.LEARNING,
+                            input_data={
+                                'content': 'Recent diverse cognitive experiences',
+                                'learning_type': 'experiential',
+                                'trigger': 'experience_diversity'
+                            }
+                        )
+            except Exception as e:
+                self.logger.error("Error checking learning trigger for %s: %s", agent_id, e)
     
     async def _check_metacognition_trigger(self, agent_id: str):
         """Check if agent should trigger metacognition"""
-        try:
-            recent_results = self.cognitive_histories.get(agent_id, [])
-            
-            # Trigger metacognition periodically
-            if len(recent_results) % 10 == 0 and len(recent_results) > 0:
-                await self.process_cognitive_request(
-                    agent_id=agent_id,
-                    process_type=CognitiveProcessType.METACOGNITION,
-                    input_data={'trigger': 'periodic_review', 'interval': 10}
-                )
-        except Exception as e:
-            self.logger.error(f"Error checking metacognition trigger for {agent_id}: {e}")
+        now = time.monotonic()
+        if now - self._last_fire.get((agent_id, 'metacog'), float('-inf')) < self._cooldowns['metacog']:
+            return
+        lock = self._trigger_locks[agent_id]
+        if lock.locked():
+            return
+        async with lock:
+            try:
+                # Trigger metacognition once every metacognition_interval results
+                if self._since_metacog[agent_id] >= self.metacognition_interval:
+                    self._since_metacog[agent_id] = 0
+                    self._last_fire[(agent_id, 'metacog')] = now
+                    await self.process_cognitive_request(
+                        agent_id=agent_id,
+                        process_type=CognitiveProcessType.METACOGNITION,
+                        input_data={'trigger': 'periodic_review', 'interval': self.metacognition_interval}
+                    )
+            except Exception as e:
+                self.logger.error("Error checking metacognition trigger for %s: %s", agent_id, e)
     
     async def _store_cognitive_memory(self, result: CognitiveResult):
         """Store cognitive processing results in memory"""
         try:
-            # Create memory item for the cognitive result
-            memory_item = MemoryItem(
-                memory_id=f"cognitive_{result.agent_id}_{result.process_id}",
-                agent_id=result.agent_id,
-                memory_type=MemoryType.EPISODIC,
-                content=f"Cognitive process: {result.result_type.value} - {json.dumps(result.result_data)}",
-                metadata={
-                    'process_type': result.result_type.value,
-                    'confidence': result.confidence,
-                    'reasoning_trace': result.reasoning_trace,
-                    'next_actions': result.next_actions,
-                    'learned_concepts': result.learned_concepts,
-                    'cognitive_timestamp': result.timestamp.isoformat()
-                }
-            )
+            updates = result.memory_updates
+            
+            # Columns for the cognitive result followed by any additional memory updates
+            memory_ids = [f"cognitive_{result.agent_id}_{result.process_id}"] + [m.memory_id for m in updates]
+            agent_ids = [result.agent_id] + [m.agent_id for m in updates]
+            memory_types = [MemoryType.EPISODIC] + [m.memory_type for m in updates]
+            contents = [f"Cognitive process: {result.result_type_value} - {result.result_data_json}"] + [m.content for m in updates]
+            metadatas = [{
+                'process_type': result.result_type_value,
+                'confidence': result.confidence,
+                'reasoning_trace': result.reasoning_trace,
+                'next_actions': result.next_actions,
+                'learned_concepts': result.learned_concepts,
+                'cognitive_timestamp': result.timestamp_iso
+            }] + [m.metadata for m in updates]
+            
+            # Submit everything as one batch
+            await self.memory_interface.store_memory_batch(memory_ids, agent_ids, memory_types, contents, metadatas)
             
-            await self.memory_interface.store_memory_item(memory_item)
-            
-            # Store any additional memory updates
-            for memory_update in result.memory_updates:
-                await self.memory_interface.store_memory_item(memory_update)
-                
         except Exception as e:
-            self.logger.error(f"Error storing cognitive memory: {e}")
+            self.logger.error("Error storing cognitive memory: %s", e)
     
     def get_agent_cognitive_state(self, agent_id: str) -> Optional[CognitiveState]:
         """Get current cognitive state of an agent"""
@@ -817,35 +952,49 @@ class CognitiveEngine:
     
     def get_cognitive_history(self, agent_id: str, limit: int = 10) -> List[CognitiveResult]:
         """Get cognitive history for an agent"""
-        history = self.cognitive_histories.get(agent_id, [])
-        return history[-limit:] if history else []
+        if agent_id not in self.cognitive_histories:
+            return []
+
+        now = time.monotonic()
+        cached = self._history_cache.get(agent_id, {}).get(limit)
+        if cached is not None and now - cached[0] < self.read_cache_ttl:
+            return list(cached[1])
+        
+        history = tuple(self._recent_results(agent_id, limit))
+        self._history_cache.setdefault(agent_id, {})[limit] = (now, history)
+        return list(history)
     
     def get_cognitive_stats(self, agent_id: str) -> Dict[str, Any]:
         """Get cognitive statistics for an agent"""
-        history = self.cognitive_histories.get(agent_id, [])
+        stats = self.agent_stats.get(agent_id)
         
-        if not history:
+        if not stats or not stats['count']:
             return {'total_processes': 0}
         
-        process_counts = {}
-        confidences = []
+        now = time.monotonic()
+        cached = self._stats_cache.get(agent_id)
+        if cached is not None and now - cached[0] < self.read_cache_ttl:
+            return self._copy_stats(cached[1])
         
-        for result in history:
-            process_type = result.result_type.value
-            process_counts[process_type] = process_counts.get(process_type, 0) + 1
-            confidences.append(result.confidence)
-        
-        return {
-            'total_processes': len(history),
-            'process_distribution': process_counts,
-            'average_confidence': sum(confidences) / len(confidences),
+        summary = {
+            'total_processes': stats['count'],
+            'process_distribution': dict(stats['types']),
+            'average_confidence': stats['conf_sum'] / stats['count'],
             'current_state': self.agent_states.get(agent_id, CognitiveState.IDLE).value,
-            'active_processes': len([p for p in self.active_processes.values() if p.agent_id == agent_id])
+            'active_processes': self._active_by_agent.get(agent_id, 0)
         }
+        self._stats_cache[agent_id] = (now, summary)
+        return self._copy_stats(summary)
+    
+    @staticmethod
+    def _copy_stats(summary: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a cached stats summary, including its nested distribution"""
+        return {**summary, 'process_distribution': dict(summary['process_distribution'])}
 
 
 # Global cognitive engine instance
 _global_cognitive_engine: Optional[CognitiveEngine] = None
+_init_lock = threading.Lock()
 
 
 def get_cognitive_engine(memory_interface: Optional[UnifiedMemoryInterface] = None,
@@ -853,16 +1002,21 @@ def get_cognitive_engine(memory_interface: Optional[UnifiedMemoryInterface] = No
     """Get the global cognitive engine instance"""
     global _global_cognitive_engine
     
-    if _global_cognitive_engine is None:
-        if memory_interface is None:
-            from .memory_interface import get_memory_interface
-            memory_interface = get_memory_interface()
-        
-        if message_bus is None:
-            from .message_bus import get_message_bus
-            message_bus = get_message_bus()
-        
-        _global_cognitive_engine = CognitiveEngine(memory_interface, message_bus)
+    engine = _global_cognitive_engine
+    if engine is not None:
+        return engine
+    
+    with _init_lock:
+        if _global_cognitive_engine is None:
+            if memory_interface is None:
+                from .memory_interface import get_memory_interface
+                memory_interface = get_memory_interface()
+            
+            if message_bus is None:
+                from .message_bus import get_message_bus
+                message_bus = get_message_bus()
+            
+            _global_cognitive_engine = CognitiveEngine(memory_interface, message_bus)
     
     return _global_cognitive_engine
 
@@ -16,14 +16,28 @@ Key Features:
 """
 
 import asyncio
+import functools
+import gc
 import logging
 import json
+import re
+import sys
+import threading
 import time
-from typing import Dict, List, Optional, Any, Set, Tuple
-from dataclasses import dataclass, field
+from collections import defaultdict, deque
+from typing import Dict, List, Mapping, Optional, Any, Set, Tuple, Deque, Callable, Awaitable, get_origin
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from types import MappingProxyType
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ._batch_clock import BatchClock
+from ._compat import DATACLASS_SLOTS
 from .memory_interface import UnifiedMemoryInterface, MemoryType, MemoryItem, MemoryQuery
 from .message_bus import UnifiedMessageBus, Message, MessageType, MessagePriority
 from .cognitive_engine import CognitiveEngine, CognitiveProcessType, CognitiveResult, CognitiveContext
@@ -31,6 +45,25 @@ from .attention_manager import AttentionManager, AttentionTarget, AttentionType
 from .learning_loop import LearningLoop, LearningExperience, LearningType
 
 
+# JSON encoding/decoding for message contents; orjson is used when installed
+if orjson is not None:
+    _loads = orjson.loads
+    
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+else:
+    _loads = json.loads
+    
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+# Marks a message whose content has been checked and is not a JSON object
+_NOT_JSON: Dict[str, Any] = {}
+
+# Wall clock read once per drained batch and shared by its handlers
+_BATCH_CLOCK = BatchClock('enhanced_ail_batch_clock')
+
+
 class AILMessageType(Enum):
     """Enhanced AIL message types"""
     COGNITIVE_REQUEST = "cognitive_request"
@@ -47,6 +80,10 @@ class AILMessageType(Enum):
     COMMAND = "command"
 
 
+# Dense per-member index used for list-based handler dispatch
+_AIL_TYPE_INDEX = {message_type: index for index, message_type in enumerate(AILMessageType)}
+
+
 class CognitiveIntentType(Enum):
     """Types of cognitive intent in messages"""
     INFORM = "inform"
@@ -61,7 +98,12 @@ class CognitiveIntentType(Enum):
     EVALUATE = "evaluate"
 
 
-@dataclass
+# Enum values resolved once for the per-message metadata paths
+_AIL_TYPE_VALUE: Dict[AILMessageType, str] = {t: t.value for t in AILMessageType}
+_INTENT_VALUE: Dict[CognitiveIntentType, str] = {i: i.value for i in CognitiveIntentType}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class AILCognitiveContext:
     """Cognitive context for AIL messages"""
     sender_attention_state: Optional[Dict[str, Any]] = None
@@ -75,7 +117,7 @@ class AILCognitiveContext:
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnhancedAILMessage:
     """Enhanced AIL message with cognitive components"""
     message_id: str
@@ -92,9 +134,10 @@ class EnhancedAILMessage:
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     processed_at: Optional[datetime] = None
+    _parsed_content: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AILProcessingResult:
     """Result of AIL message processing"""
     message_id: str
@@ -109,6 +152,129 @@ class AILProcessingResult:
     errors: List[str] = field(default_factory=list)
 
 
+# Field tables used to merge handler output into an AILProcessingResult
+_AIL_RESULT_FIELDS = frozenset(f.name for f in fields(AILProcessingResult))
+_AIL_RESULT_LIST_FIELDS = frozenset(f.name for f in fields(AILProcessingResult) if get_origin(f.type) is list)
+
+
+class _TokenBucket:
+    """Token bucket used to rate-limit repetitive log output"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+    
+    def consume(self) -> bool:
+        """Take one token if available"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+
+class _MicroBatcher:
+    """
+    Coalesces items submitted close together into a single batched call.
+    
+    ``submit`` returns a future resolved with the matching element of the
+    list returned by ``flush``. A batch is flushed once ``max_batch_size``
+    items are waiting or ``max_wait`` seconds after its first item arrived.
+    """
+    
+    def __init__(self, flush: Callable[[List[Any]], Awaitable[List[Any]]],
+                 max_batch_size: int = 32, max_wait: float = 0.01):
+        self.flush = flush
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: Optional[asyncio.Queue] = None  # created lazily inside the running loop
+        self._task: Optional[asyncio.Task] = None
+    
+    def submit(self, item: Any) -> asyncio.Future:
+        """Queue an item for the next batch"""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run_loop())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        return future
+    
+    async def _run_loop(self):
+        """Collect submitted items and flush them in batches until a None sentinel is queued"""
+        queue = self._queue
+        batch: List[Tuple[Any, asyncio.Future]] = []
+        stopping = False
+        try:
+            while not stopping:
+                entry = await queue.get()
+                if entry is None:
+                    break
+                batch = [entry]
+                if queue.qsize() < self.max_batch_size - 1:
+                    await asyncio.sleep(self.max_wait)
+                while len(batch) < self.max_batch_size:
+                    try:
+                        entry = queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if entry is None:
+                        stopping = True
+                        break
+                    batch.append(entry)
+                await self._flush_batch(batch)
+                batch = []
+        except asyncio.CancelledError:
+            # Never leave the submitters of a held batch waiting forever
+            self._fail_pending(batch, RuntimeError("Micro-batcher cancelled before flushing"))
+    
+    async def _flush_batch(self, batch: List[Tuple[Any, asyncio.Future]]):
+        """Run the flush callable and resolve each item's future"""
+        try:
+            results = await self.flush([item for item, _ in batch])
+        except Exception as e:
+            self._fail_pending(batch, e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+        self._fail_pending(batch, RuntimeError("Micro-batcher flush returned too few results"))
+    
+    @staticmethod
+    def _fail_pending(batch: List[Tuple[Any, asyncio.Future]], error: BaseException):
+        """Set ``error`` on every future in the batch that is still unresolved"""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+    
+    async def close(self):
+        """Flush everything submitted so far and stop the batching task"""
+        if self._task:
+            if not self._task.done():
+                self._queue.put_nowait(None)
+                try:
+                    await self._task
+                except asyncio.CancelledError:
+                    pass
+            self._task = None
+        if self._queue is None:
+            return
+        batch = []
+        while True:
+            try:
+                entry = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if entry is not None:
+                batch.append(entry)
+        if batch:
+            await self._flush_batch(batch)
+
+
 class EnhancedAILProcessor:
     """
     Enhanced AIL processor with cognitive integration.
@@ -117,11 +283,31 @@ class EnhancedAILProcessor:
     understanding, attention management, and learning integration.
     """
     
+    # Keywords that signal each cognitive process. A keyword matches at the start of
+    # a word, so inflected forms count too ("learning", "planning", "options")
+    _COGNITIVE_KEYWORDS: Dict[CognitiveProcessType, Tuple[str, ...]] = {
+        CognitiveProcessType.REASONING: ('why', 'because', 'reason', 'cause'),
+        CognitiveProcessType.DECISION_MAKING: ('decide', 'choose', 'option', 'alternative'),
+        CognitiveProcessType.PLANNING: ('plan', 'strategy', 'approach', 'steps'),
+        CognitiveProcessType.LEARNING: ('learn', 'teach', 'knowledge', 'understand'),
+        CognitiveProcessType.REFLECTION: ('reflect', 'think about', 'consider', 'ponder'),
+        CognitiveProcessType.EVALUATION: ('evaluate', 'assess', 'judge', 'rate'),
+    }
+    _COMPLEX_INDICATORS = ('complex', 'complicated', 'detailed', 'thorough', 'comprehensive')
+    # All stems in one pattern; each match's group names the process it signals
+    _KEYWORD_RE = re.compile('|'.join(
+        [rf"(?P<{process_type.name}>\b(?:{'|'.join(keywords)}))"
+         for process_type, keywords in _COGNITIVE_KEYWORDS.items()]
+        + [rf"(?P<COMPLEX>\b(?:{'|'.join(_COMPLEX_INDICATORS)}))"]
+    ))
+    _ANALYSIS_CACHE_MAX_CHARS = 2048  # longer contents are analyzed without caching
+    
     def __init__(self, memory_interface: UnifiedMemoryInterface,
                  message_bus: UnifiedMessageBus,
                  cognitive_engine: CognitiveEngine,
                  attention_manager: AttentionManager,
-                 learning_loop: LearningLoop):
+                 learning_loop: LearningLoop,
+                 freeze_gc: bool = False):
         self.memory_interface = memory_interface
         self.message_bus = message_bus
         self.cognitive_engine = cognitive_engine
@@ -130,12 +316,20 @@ class EnhancedAILProcessor:
         self.logger = logging.getLogger(f"{__name__}.EnhancedAILProcessor")
         
         # Processing state
-        self.processing_queue: Dict[str, List[EnhancedAILMessage]] = {}
+        self.processing_queue: Dict[str, asyncio.Queue] = {}
+        self._active_agents: Set[str] = set()  # agents with messages waiting in their queue
         self.active_collaborations: Dict[str, Dict[str, Any]] = {}
-        self.message_history: Dict[str, List[EnhancedAILMessage]] = {}
+        self.history_cap = 512  # messages kept per sender
+        self.message_history: Dict[str, Deque[EnhancedAILMessage]] = defaultdict(
+            lambda: deque(maxlen=self.history_cap)
+        )
+        self._total_messages = 0
+        self._queued_messages = 0  # messages waiting across all agent queues
         
-        # Processing handlers
-        self.message_handlers: Dict[AILMessageType, callable] = {}
+        # Processing handlers; message_handlers is a read-only view, change it through
+        # register_message_handler so the dispatch table stays in sync
+        self._message_handlers: Dict[AILMessageType, Callable] = {}
+        self.message_handlers: Mapping[AILMessageType, Callable] = MappingProxyType(self._message_handlers)
         self._register_message_handlers()
         
         # Cognitive processing parameters
@@ -143,14 +337,62 @@ class EnhancedAILProcessor:
         self.collaboration_threshold = 0.7
         self.attention_update_threshold = 0.6
         self.learning_value_threshold = 0.5
+        self.max_batch_size = 100  # messages drained from an agent queue per pass
+        # Messages below this priority from senders the agent has not recently
+        # attended to skip attention filtering until the next full filter pass
+        self.prefilter_priority_cutoff = self.attention_update_threshold / 2
+        self.full_filter_interval = 1.0  # seconds between passes that skip the prefilter
+        self.attended_sender_ttl = 60.0  # seconds a sender stays recently attended
+        self.max_attended_senders = 1000  # per agent
+        self._attended_senders: Dict[str, Dict[str, float]] = {}  # sender -> last attended, oldest first
+        
+        # Sender attention/learning summaries reused for bursts of outgoing messages
+        self.context_cache_ttl = 0.05  # seconds
+        self._attention_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._learning_summary_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         
-        # Background processing
-        self._processing_task = None
+        # Stable part of the bus metadata per (message type, intent)
+        self._bus_template_cache: Dict[Tuple[AILMessageType, CognitiveIntentType], Dict[str, Any]] = {}
+        
+        # Send failures are logged with tracebacks at most 10 times per second
+        self._err_tokens = _TokenBucket(rate=10.0, capacity=10.0)
+        
+        # Background processing: one worker per receiving agent
         self._running = False
+        self._agent_workers: Dict[str, asyncio.Task] = {}
+        self._agent_events: Dict[str, asyncio.Event] = {}  # set when an agent's queue receives work
+        self.max_concurrent_agents = 8
+        self._concurrency_sem: Optional[asyncio.Semaphore] = None  # created in start()
+        self.batch_window = 0.005  # seconds to coalesce bursts before draining
+        self.deferred_recheck_interval = 0.5  # seconds before deferred messages are re-offered
+        self.idle_recheck_interval = 5.0  # seconds between wakeups while the queue is empty
+        # Optionally move objects alive at start() into the permanent GC generation so
+        # the collections triggered by per-message allocations do not rescan them.
+        # This affects the whole process, so it is left to the host application.
+        self.freeze_gc = freeze_gc
+        self._gc_frozen = False
+        
+        # Outgoing bus messages are buffered and flushed in batches
+        self._outbox: Optional[asyncio.Queue] = None  # created lazily inside the running loop
+        self._outbox_task: Optional[asyncio.Task] = None
+        self.outbox_max_size = 10000
+        self.outbox_batch_size = 100
+        self.outbox_flush_interval = 0.005  # seconds
+        
+        # Side effects of processed messages are coalesced across agent workers
+        self._attention_batcher = _MicroBatcher(self._apply_attention_updates)
+        self._learning_batcher = _MicroBatcher(lambda exps: self.learning_loop.add_learning_experiences(exps))
+        self._memory_batcher = _MicroBatcher(self._store_memory_items)
+        
+        # Memory writes run in the background so they never delay responses
+        self.max_cold_tasks = 1000  # pending background writes before new ones are awaited inline
+        self.cold_write_concurrency = 16
+        self._cold_sem: Optional[asyncio.Semaphore] = None  # created in start()
+        self._cold_tasks: Set[asyncio.Task] = set()
     
     def _register_message_handlers(self):
         """Register message type handlers"""
-        self.message_handlers = {
+        self._message_handlers.update({
             AILMessageType.COGNITIVE_REQUEST: self._handle_cognitive_request,
             AILMessageType.COGNITIVE_RESPONSE: self._handle_cognitive_response,
             AILMessageType.KNOWLEDGE_SHARE: self._handle_knowledge_share,
@@ -163,7 +405,19 @@ class EnhancedAILProcessor:
             AILMessageType.RESPONSE: self._handle_response,
             AILMessageType.NOTIFICATION: self._handle_notification,
             AILMessageType.COMMAND: self._handle_command,
-        }
+        })
+        self._rebuild_handler_table()
+    
+    def register_message_handler(self, message_type: AILMessageType, handler: Callable):
+        """Register or replace the handler for a message type"""
+        self._message_handlers[message_type] = handler
+        self._rebuild_handler_table()
+    
+    def _rebuild_handler_table(self):
+        """Rebuild the list-indexed dispatch table from the registered handlers"""
+        self._handler_table: Tuple[Optional[Callable], ...] = tuple(
+            self._message_handlers.get(message_type) for message_type in AILMessageType
+        )
     
     async def start(self):
         """Start the enhanced AIL processor"""
@@ -171,120 +425,347 @@ class EnhancedAILProcessor:
             return
         
         self._running = True
-        self._processing_task = asyncio.create_task(self._processing_loop())
+        self._concurrency_sem = asyncio.Semaphore(self.max_concurrent_agents)
+        self._cold_sem = asyncio.Semaphore(self.cold_write_concurrency)
+        if self.freeze_gc and not self._gc_frozen:
+            gc.freeze()
+            self._gc_frozen = True
+        for agent_id in self._active_agents:
+            self._ensure_worker(agent_id)
         self.logger.info("Enhanced AIL processor started")
     
     async def stop(self):
         """Stop the enhanced AIL processor"""
         self._running = False
-        if self._processing_task:
-            self._processing_task.cancel()
-            try:
-                await self._processing_task
-            except asyncio.CancelledError:
-                pass
+        workers = list(self._agent_workers.values())
+        self._agent_workers.clear()
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        # Let the outbox flusher send everything already buffered, then exit
+        if self._outbox_task:
+            if not self._outbox_task.done():
+                await self._outbox.put(None)
+                try:
+                    await self._outbox_task
+                except asyncio.CancelledError:
+                    pass
+            self._outbox_task = None
+        if self._cold_tasks:
+            await asyncio.gather(*self._cold_tasks, return_exceptions=True)
+        for batcher in (self._attention_batcher, self._learning_batcher, self._memory_batcher):
+            await batcher.close()
+        await self._flush_outbox_remaining()
+        if self._gc_frozen:
+            gc.unfreeze()
+            self._gc_frozen = False
         self.logger.info("Enhanced AIL processor stopped")
     
-    async def _processing_loop(self):
-        """Main processing loop"""
+    def _get_agent_event(self, agent_id: str) -> asyncio.Event:
+        """Get the event signalled when messages are enqueued for an agent"""
+        event = self._agent_events.get(agent_id)
+        if event is None:
+            event = self._agent_events[agent_id] = asyncio.Event()
+        return event
+    
+    def _ensure_worker(self, agent_id: str):
+        """Start the agent's queue worker if the processor is running and it has none"""
+        if not self._running:
+            return
+        worker = self._agent_workers.get(agent_id)
+        if worker is None or worker.done():
+            self._agent_workers[agent_id] = asyncio.create_task(self._agent_worker_loop(agent_id))
+    
+    async def _agent_worker_loop(self, agent_id: str):
+        """Process one agent's queue whenever it receives work"""
+        event = self._get_agent_event(agent_id)
+        queue = self.processing_queue[agent_id]
+        if not queue.empty():
+            event.set()
+        last_full_filter = time.monotonic()
+        
         while self._running:
             try:
-                # Process queued messages for all agents
-                for agent_id in list(self.processing_queue.keys()):
-                    await self._process_agent_queue(agent_id)
+                # Sleep until work arrives; messages attention deferred are re-offered shortly
+                timeout = self.idle_recheck_interval if queue.empty() else self.deferred_recheck_interval
+                timed_out = False
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    timed_out = True
+                event.clear()
+                await asyncio.sleep(self.batch_window)
+                
+                # Prefiltered messages also get the full filter periodically under steady traffic
+                now = time.monotonic()
+                full_filter = timed_out or now - last_full_filter >= self.full_filter_interval
+                if full_filter:
+                    last_full_filter = now
                 
-                await asyncio.sleep(0.5)  # High frequency processing
+                async with self._concurrency_sem:
+                    more_pending = await self._process_agent_queue(agent_id, prefilter=not full_filter)
+                if more_pending:
+                    event.set()
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.error(f"Error in processing loop: {e}")
+                self.logger.error(f"Error in processing worker for {agent_id}: {e}")
                 await asyncio.sleep(1.0)
     
-    async def _process_agent_queue(self, agent_id: str):
-        """Process message queue for a specific agent"""
+    async def _process_agent_queue(self, agent_id: str, prefilter: bool = True) -> bool:
+        """
+        Process message queue for a specific agent.
+        Returns True if the pass made progress and messages are still queued,
+        either left over from a full batch or held back by attention.
+        """
         try:
-            queue = self.processing_queue.get(agent_id, [])
-            if not queue:
-                return
-            
-            # Process messages with attention filtering
-            filtered_messages = await self._filter_messages_by_attention(agent_id, queue)
-            
-            # Process each filtered message
-            for message in filtered_messages:
-                try:
-                    result = await self._process_enhanced_message(message)
-                    await self._handle_processing_result(result)
+            queue = self.processing_queue.get(agent_id)
+            if queue is None or queue.empty():
+                return False
+            
+            with _BATCH_CLOCK.batch():
+                # Drain a batch of pending messages
+                batch = []
+                while len(batch) < self.max_batch_size:
+                    try:
+                        batch.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                self._queued_messages -= len(batch)
+                
+                # Process messages with attention filtering
+                filtered_messages = await self._filter_messages_by_attention(agent_id, batch, prefilter)
+                
+                # Messages held back by attention go back on the queue for a later pass
+                if len(filtered_messages) < len(batch):
+                    accepted = {id(message) for message in filtered_messages}
+                    for message in batch:
+                        if id(message) not in accepted:
+                            queue.put_nowait(message)
+                            self._queued_messages += 1
+                if queue.empty():
+                    self._active_agents.discard(agent_id)
+                
+                # Process each filtered message
+                for message in filtered_messages:
+                    try:
+                        result = await self._process_enhanced_message(message)
+                        await self._handle_processing_result(result)
                     
-                    # Remove from queue
-                    if message in self.processing_queue[agent_id]:
-                        self.processing_queue[agent_id].remove(message)
-                        
-                except Exception as e:
-                    self.logger.error(f"Error processing message {message.message_id}: {e}")
+                    except Exception as e:
+                        self.logger.error(f"Error processing message {message.message_id}: {e}")
+                
+                return bool(filtered_messages) and not queue.empty()
             
         except Exception as e:
             self.logger.error(f"Error processing queue for {agent_id}: {e}")
+            return False
+    
+    @staticmethod
+    def _now() -> datetime:
+        """Time of the batch being processed, or the live clock outside a batch"""
+        return _BATCH_CLOCK.now()
+    
+    @staticmethod
+    def _next_stamp() -> str:
+        """Unique time stamp for memory ids: clock milliseconds plus a running counter"""
+        return _BATCH_CLOCK.next_stamp()
     
     async def send_enhanced_ail_message(self, message: EnhancedAILMessage) -> bool:
         """Send an enhanced AIL message"""
         try:
+            self._intern_agent_ids(message)
+            
             # Enrich message with sender's cognitive context
             await self._enrich_message_context(message)
             
             # Add to receiver's processing queue
             receiver_id = message.receiver_id
             if receiver_id not in self.processing_queue:
-                self.processing_queue[receiver_id] = []
+                self.processing_queue[receiver_id] = asyncio.Queue()
             
-            self.processing_queue[receiver_id].append(message)
+            await self.processing_queue[receiver_id].put(message)
+            self._queued_messages += 1
+            self._active_agents.add(receiver_id)
+            self._get_agent_event(receiver_id).set()
+            self._ensure_worker(receiver_id)
             
             # Store in message history
-            if message.sender_id not in self.message_history:
-                self.message_history[message.sender_id] = []
             self.message_history[message.sender_id].append(message)
+            self._total_messages += 1
             
             # Send via message bus for external systems
-            bus_message = Message(
-                message_id=message.message_id,
-                sender_id=message.sender_id,
-                recipient_id=message.receiver_id,
-                content=message.content,
-                message_type=MessageType.AIL_COGNITION,
-                priority=MessagePriority.NORMAL if message.attention_priority < 0.8 else MessagePriority.HIGH,
-                metadata={
-                    'ail_message_type': message.message_type.value,
-                    'cognitive_intent': message.cognitive_intent.value,
-                    'attention_priority': message.attention_priority,
-                    'learning_value': message.learning_value,
-                    'collaboration_potential': message.collaboration_potential
-                }
-            )
-            
-            await self.message_bus.send_message(bus_message)
+            bus_message = self._build_bus_message(message)
+            await self._get_outbox().put(bus_message)
             
             self.logger.debug(f"Sent enhanced AIL message: {message.message_id}")
             return True
-            
-        except Exception as e:
-            self.logger.error(f"Error sending enhanced AIL message: {type(e).__name__}: {str(e)}")
-            import traceback
-            self.logger.error(f"Traceback: {traceback.format_exc()}")
+        
+        except Exception:
+            if self._err_tokens.consume():
+                self.logger.exception("Error sending enhanced AIL message")
             return False
     
+    async def send_enhanced_ail_messages(self, messages: List[EnhancedAILMessage]) -> List[bool]:
+        """
+        Send several enhanced AIL messages.
+        
+        Each receiver's worker is woken once for the whole batch. Returns one
+        success flag per message, in input order.
+        """
+        results = []
+        receivers: Set[str] = set()
+        outbox = self._get_outbox()
+        for message in messages:
+            try:
+                self._intern_agent_ids(message)
+                await self._enrich_message_context(message)
+                
+                receiver_id = message.receiver_id
+                queue = self.processing_queue.get(receiver_id)
+                if queue is None:
+                    queue = self.processing_queue[receiver_id] = asyncio.Queue()
+                queue.put_nowait(message)
+                self._queued_messages += 1
+                receivers.add(receiver_id)
+                
+                self.message_history[message.sender_id].append(message)
+                self._total_messages += 1
+                
+                await outbox.put(self._build_bus_message(message))
+                results.append(True)
+            
+            except Exception:
+                if self._err_tokens.consume():
+                    self.logger.exception("Error sending enhanced AIL message")
+                results.append(False)
+        
+        for receiver_id in receivers:
+            self._active_agents.add(receiver_id)
+            self._get_agent_event(receiver_id).set()
+            self._ensure_worker(receiver_id)
+        
+        self.logger.debug(f"Sent {sum(results)} of {len(messages)} enhanced AIL messages")
+        return results
+    
+    @staticmethod
+    def _intern_agent_ids(message: EnhancedAILMessage):
+        """Share one string object per agent id across histories, memories and metadata"""
+        message.sender_id = sys.intern(message.sender_id)
+        message.receiver_id = sys.intern(message.receiver_id)
+    
+    def _build_bus_message(self, message: EnhancedAILMessage) -> Message:
+        """Build the message bus copy of an AIL message for external systems"""
+        template_key = (message.message_type, message.cognitive_intent)
+        template = self._bus_template_cache.get(template_key)
+        if template is None:
+            template = self._bus_template_cache[template_key] = {
+                'ail_message_type': _AIL_TYPE_VALUE[message.message_type],
+                'cognitive_intent': _INTENT_VALUE[message.cognitive_intent]
+            }
+        
+        return Message(
+            message_id=message.message_id,
+            sender_id=message.sender_id,
+            recipient_id=message.receiver_id,
+            content=message.content,
+            message_type=MessageType.AIL_COGNITION,
+            priority=MessagePriority.NORMAL if message.attention_priority < 0.8 else MessagePriority.HIGH,
+            metadata={
+                **template,
+                'attention_priority': message.attention_priority,
+                'learning_value': message.learning_value,
+                'collaboration_potential': message.collaboration_potential
+            }
+        )
+    
+    def _get_outbox(self) -> asyncio.Queue:
+        """Get the outgoing bus message buffer, starting its flusher on first use"""
+        if self._outbox is None:
+            self._outbox = asyncio.Queue(maxsize=self.outbox_max_size)
+        if self._outbox_task is None or self._outbox_task.done():
+            self._outbox_task = asyncio.create_task(self._outbox_loop())
+        return self._outbox
+    
+    async def _outbox_loop(self):
+        """Flush buffered bus messages in batches until a None sentinel is queued"""
+        outbox = self._outbox
+        stopping = False
+        while not stopping:
+            try:
+                bus_message = await outbox.get()
+                if bus_message is None:
+                    break
+                batch = [bus_message]
+                
+                # Give a burst a moment to accumulate unless a full batch is already waiting
+                if outbox.qsize() < self.outbox_batch_size - 1:
+                    await asyncio.sleep(self.outbox_flush_interval)
+                while len(batch) < self.outbox_batch_size:
+                    try:
+                        bus_message = outbox.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if bus_message is None:
+                        stopping = True
+                        break
+                    batch.append(bus_message)
+                
+                await self._send_bus_batch(batch)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error in outbox loop: {e}")
+    
+    async def _flush_outbox_remaining(self):
+        """Send whatever is still buffered in the outbox"""
+        if self._outbox is None:
+            return
+        batch = []
+        while True:
+            try:
+                bus_message = self._outbox.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if bus_message is not None:
+                batch.append(bus_message)
+        if batch:
+            await self._send_bus_batch(batch)
+    
+    async def _send_bus_batch(self, batch: List[Message]):
+        """Send a batch of bus messages concurrently"""
+        results = await asyncio.gather(
+            *(self.message_bus.send_message(bus_message) for bus_message in batch),
+            return_exceptions=True
+        )
+        for bus_message, result in zip(batch, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error sending bus message {bus_message.message_id}: {result}")
+    
     async def _enrich_message_context(self, message: EnhancedAILMessage):
         """Enrich message with sender's cognitive context"""
         try:
             sender_id = message.sender_id
+            now = time.monotonic()
             
             # Get sender's attention state
-            attention_summary = await self.attention_manager.get_attention_summary(sender_id)
+            cached = self._attention_cache.get(sender_id)
+            if cached is not None and now - cached[0] < self.context_cache_ttl:
+                attention_summary = cached[1]
+            else:
+                attention_summary = await self.attention_manager.get_attention_summary(sender_id)
+                self._attention_cache[sender_id] = (now, attention_summary)
             if 'error' not in attention_summary:
                 message.cognitive_context.sender_attention_state = attention_summary
                 message.cognitive_context.sender_cognitive_load = attention_summary.get('cognitive_load', 0.0)
             
             # Get sender's learning goals
-            learning_summary = self.learning_loop.get_learning_summary(sender_id)
+            cached = self._learning_summary_cache.get(sender_id)
+            if cached is not None and now - cached[0] < self.context_cache_ttl:
+                learning_summary = cached[1]
+            else:
+                learning_summary = self.learning_loop.get_learning_summary(sender_id)
+                self._learning_summary_cache[sender_id] = (now, learning_summary)
             if 'error' not in learning_summary:
                 # Extract learning objectives from active goals
                 learning_goals = []
@@ -296,45 +777,58 @@ class EnhancedAILProcessor:
             
             # Analyze message for cognitive requirements
             await self._analyze_cognitive_requirements(message)
-            
+        
         except Exception as e:
             self.logger.error(f"Error enriching message context: {e}")
     
     async def _analyze_cognitive_requirements(self, message: EnhancedAILMessage):
         """Analyze message for cognitive processing requirements"""
         try:
-            content = message.content.lower()
-            
-            # Detect required cognitive processes
-            if any(word in content for word in ['why', 'because', 'reason', 'cause']):
-                message.cognitive_context.required_cognitive_processes.append(CognitiveProcessType.REASONING)
-            
-            if any(word in content for word in ['decide', 'choose', 'option', 'alternative']):
-                message.cognitive_context.required_cognitive_processes.append(CognitiveProcessType.DECISION_MAKING)
-            
-            if any(word in content for word in ['plan', 'strategy', 'approach', 'steps']):
-                message.cognitive_context.required_cognitive_processes.append(CognitiveProcessType.PLANNING)
-            
-            if any(word in content for word in ['learn', 'teach', 'knowledge', 'understand']):
-                message.cognitive_context.required_cognitive_processes.append(CognitiveProcessType.LEARNING)
-            
-            if any(word in content for word in ['reflect', 'think about', 'consider', 'ponder']):
-                message.cognitive_context.required_cognitive_processes.append(CognitiveProcessType.REFLECTION)
-            
-            if any(word in content for word in ['evaluate', 'assess', 'judge', 'rate']):
-                message.cognitive_context.required_cognitive_processes.append(CognitiveProcessType.EVALUATION)
-            
-            # Set reasoning depth based on complexity
-            complex_indicators = ['complex', 'complicated', 'detailed', 'thorough', 'comprehensive']
-            if any(indicator in content for indicator in complex_indicators):
-                message.cognitive_context.reasoning_depth = min(3, message.cognitive_context.reasoning_depth + 1)
+            content = message.content
+            if len(content) <= self._ANALYSIS_CACHE_MAX_CHARS:
+                processes, depth_increase = self._analyze_content_cached(content)
+            else:
+                processes, depth_increase = self._analyze_content(content)
             
+            context = message.cognitive_context
+            context.required_cognitive_processes.extend(processes)
+            if depth_increase:
+                context.reasoning_depth = min(3, context.reasoning_depth + depth_increase)
+        
         except Exception as e:
             self.logger.error(f"Error analyzing cognitive requirements: {e}")
     
-    async def _filter_messages_by_attention(self, agent_id: str, messages: List[EnhancedAILMessage]) -> List[EnhancedAILMessage]:
+    @classmethod
+    def _analyze_content(cls, content: str) -> Tuple[Tuple[CognitiveProcessType, ...], int]:
+        """Detect the cognitive processes and extra reasoning depth a message content calls for"""
+        found = {match.lastgroup for match in cls._KEYWORD_RE.finditer(content.lower())}
+        
+        # Detect required cognitive processes
+        processes = tuple(
+            process_type for process_type in cls._COGNITIVE_KEYWORDS if process_type.name in found
+        )
+        
+        # Increase reasoning depth based on complexity
+        depth_increase = 1 if 'COMPLEX' in found else 0
+        return processes, depth_increase
+    
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _analyze_content_cached(cls, content: str) -> Tuple[Tuple[CognitiveProcessType, ...], int]:
+        """Memoized _analyze_content for repeated (templated) message contents"""
+        return cls._analyze_content(content)
+    
+    async def _filter_messages_by_attention(self, agent_id: str, messages: List[EnhancedAILMessage],
+                                            prefilter: bool = True) -> List[EnhancedAILMessage]:
         """Filter messages based on agent's attention state"""
         try:
+            if prefilter:
+                # Cheap first pass: only priority messages or known senders reach the full filter
+                recent_senders = self._recent_senders(agent_id)
+                cutoff = self.prefilter_priority_cutoff
+                messages = [msg for msg in messages
+                            if msg.attention_priority >= cutoff or msg.sender_id in recent_senders]
+            
             if not messages:
                 return []
             
@@ -354,344 +848,353 @@ class EnhancedAILProcessor:
             
             # Extract original message objects
             filtered_messages = [item['message_obj'] for item in filtered_info]
+            if filtered_messages:
+                self._record_attended_senders(agent_id, filtered_messages)
             
             self.logger.debug(f"Filtered {len(messages)} messages to {len(filtered_messages)} for {agent_id}")
             return filtered_messages
-            
+        
         except Exception as e:
             self.logger.error(f"Error filtering messages by attention: {e}")
             return messages  # Return unfiltered on error
     
+    def _recent_senders(self, agent_id: str) -> Dict[str, float]:
+        """Senders the agent attended to within attended_sender_ttl"""
+        senders = self._attended_senders.get(agent_id)
+        if not senders:
+            return {}
+        expiry = time.monotonic() - self.attended_sender_ttl
+        while senders:
+            oldest = next(iter(senders))
+            if senders[oldest] >= expiry:
+                break
+            del senders[oldest]
+        return senders
+    
+    def _record_attended_senders(self, agent_id: str, messages: List[EnhancedAILMessage]):
+        """Mark the senders of attended messages as recent, evicting the oldest over the limit"""
+        senders = self._attended_senders.setdefault(agent_id, {})
+        now = time.monotonic()
+        for msg in messages:
+            senders.pop(msg.sender_id, None)  # re-insert so the dict stays ordered by last attention
+            senders[msg.sender_id] = now
+        while len(senders) > self.max_attended_senders:
+            del senders[next(iter(senders))]
+    
     async def _process_enhanced_message(self, message: EnhancedAILMessage) -> AILProcessingResult:
         """Process an enhanced AIL message"""
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
         
         try:
             result = AILProcessingResult(message_id=message.message_id)
             
             # Get appropriate handler
-            handler = self.message_handlers.get(message.message_type)
+            handler = self._handler_table[_AIL_TYPE_INDEX[message.message_type]]
             if not handler:
                 result.errors.append(f"No handler for message type: {message.message_type}")
                 return result
             
-            # Process the message
-            handler_result = await handler(message)
+            # Handler failures are reported in the result
+            try:
+                handler_result = await handler(message)
+            except Exception as e:
+                handler_result = self._handler_error(message, e)
             
             # Merge handler result
             if isinstance(handler_result, dict):
                 for key, value in handler_result.items():
-                    if hasattr(result, key) and value:
-                        if isinstance(getattr(result, key), list):
-                            getattr(result, key).extend(value if isinstance(value, list) else [value])
-                        else:
-                            setattr(result, key, value)
-            
-            # Update attention if message has high attention priority
+                    if not value:
+                        continue
+                    if key in _AIL_RESULT_LIST_FIELDS:
+                        getattr(result, key).extend(value if isinstance(value, list) else (value,))
+                    elif key in _AIL_RESULT_FIELDS:
+                        setattr(result, key, value)
+            
+            # Attention and learning updates only apply above their thresholds
             if message.attention_priority >= self.attention_update_threshold:
-                attention_target = AttentionTarget(
-                    target_id=message.message_id,
-                    target_type='message',
-                    content=message.content,
-                    priority=message.attention_priority,
-                    relevance=message.attention_priority
-                )
-                result.attention_updates.append(attention_target)
-            
-            # Create learning experience if message has learning value
+                result.attention_updates.append(self._build_attention_update(message))
             if message.learning_value >= self.learning_value_threshold:
-                learning_exp = LearningExperience(
-                    experience_id=f"msg_learning_{message.message_id}",
-                    agent_id=message.receiver_id,
-                    learning_type=LearningType.COLLABORATIVE if message.collaboration_potential > 0.5 else LearningType.OBSERVATIONAL,
-                    context={
-                        'sender': message.sender_id,
-                        'message_type': message.message_type.value,
-                        'cognitive_intent': message.cognitive_intent.value
-                    },
-                    action_taken='process_message',
-                    outcome={'processed': True},
-                    success_score=0.8,  # Assume successful processing
-                    confidence=message.learning_value
-                )
-                result.learning_experiences.append(learning_exp)
+                result.learning_experiences.append(self._build_learning_experience(message))
             
             result.processed = True
-            message.processed_at = datetime.now(timezone.utc)
-            
+            message.processed_at = self._now()
+        
         except Exception as e:
             result.errors.append(str(e))
             self.logger.error(f"Error processing enhanced message {message.message_id}: {e}")
         
         finally:
-            result.processing_time = asyncio.get_event_loop().time() - start_time
+            result.processing_time = time.perf_counter() - start_time
         
         return result
     
+    def _handler_error(self, message: EnhancedAILMessage, error: Exception) -> Dict[str, Any]:
+        """Log a handler failure and turn it into the handler's result"""
+        self.logger.error(f"Error handling {_AIL_TYPE_VALUE[message.message_type]} message {message.message_id}: {error}",
+                          exc_info=error)
+        return {'errors': [str(error)]}
+    
+    def _build_attention_update(self, message: EnhancedAILMessage) -> AttentionTarget:
+        """Build an attention target for a high attention priority message"""
+        return AttentionTarget(
+            target_id=message.message_id,
+            target_type='message',
+            content=message.content,
+            priority=message.attention_priority,
+            relevance=message.attention_priority
+        )
+    
+    def _build_learning_experience(self, message: EnhancedAILMessage) -> LearningExperience:
+        """Build a learning experience for a message with learning value"""
+        return LearningExperience(
+            experience_id=f"msg_learning_{message.message_id}",
+            agent_id=message.receiver_id,
+            learning_type=LearningType.COLLABORATIVE if message.collaboration_potential > 0.5 else LearningType.OBSERVATIONAL,
+            context={
+                'sender': message.sender_id,
+                'message_type': _AIL_TYPE_VALUE[message.message_type],
+                'cognitive_intent': _INTENT_VALUE[message.cognitive_intent]
+            },
+            action_taken='process_message',
+            outcome={'processed': True},
+            success_score=0.8,  # Assume successful processing
+            confidence=message.learning_value
+        )
+    
+    def _get_content_dict(self, message: EnhancedAILMessage, fallback_key: str) -> Dict[str, Any]:
+        """Get the message content as a dict, parsing JSON content at most once per message"""
+        parsed = message._parsed_content
+        if parsed is None:
+            parsed = _loads(message.content) if message.content[:1] == '{' else _NOT_JSON
+            message._parsed_content = parsed
+        if parsed is _NOT_JSON:
+            return {fallback_key: message.content}
+        return parsed
+    
     async def _handle_cognitive_request(self, message: EnhancedAILMessage) -> Dict[str, Any]:
         """Handle cognitive request message"""
-        try:
-            # Parse the cognitive request
-            request_data = json.loads(message.content) if message.content.startswith('{') else {'query': message.content}
-            
-            # Determine cognitive process type
-            if message.cognitive_context.required_cognitive_processes:
-                process_type = message.cognitive_context.required_cognitive_processes[0]
-            else:
-                process_type = CognitiveProcessType.REASONING  # Default
-            
-            # Process cognitive request
-            cognitive_result = await self.cognitive_engine.process_cognitive_request(
-                agent_id=message.receiver_id,
-                process_type=process_type,
-                input_data=request_data
-            )
-            
-            # Create response message
-            response = EnhancedAILMessage(
-                message_id=f"response_{message.message_id}",
-                sender_id=message.receiver_id,
-                receiver_id=message.sender_id,
-                message_type=AILMessageType.COGNITIVE_RESPONSE,
-                cognitive_intent=CognitiveIntentType.INFORM,
-                content=json.dumps(cognitive_result.result_data),
-                attention_priority=message.attention_priority,
-                learning_value=0.6  # Responses have learning value
-            )
-            
-            return {
-                'cognitive_response': cognitive_result,
-                'response_messages': [response]
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Error handling cognitive request: {e}")
-            return {'errors': [str(e)]}
+        # Parse the cognitive request
+        request_data = self._get_content_dict(message, 'query')
+        
+        # Determine cognitive process type
+        if message.cognitive_context.required_cognitive_processes:
+            process_type = message.cognitive_context.required_cognitive_processes[0]
+        else:
+            process_type = CognitiveProcessType.REASONING  # Default
+        
+        # Process cognitive request
+        cognitive_result = await self.cognitive_engine.process_cognitive_request(
+            agent_id=message.receiver_id,
+            process_type=process_type,
+            input_data=request_data
+        )
+        
+        # Create response message
+        response = EnhancedAILMessage(
+            message_id=f"response_{message.message_id}",
+            sender_id=message.receiver_id,
+            receiver_id=message.sender_id,
+            message_type=AILMessageType.COGNITIVE_RESPONSE,
+            cognitive_intent=CognitiveIntentType.INFORM,
+            content=cognitive_result.result_data_json,
+            attention_priority=message.attention_priority,
+            learning_value=0.6  # Responses have learning value
+        )
+        
+        return {
+            'cognitive_response': cognitive_result,
+            'response_messages': [response]
+        }
     
     async def _handle_cognitive_response(self, message: EnhancedAILMessage) -> Dict[str, Any]:
         """Handle cognitive response message"""
-        try:
-            # Store cognitive response in memory
-            memory_item = MemoryItem(
-                memory_id=f"cog_response_{message.receiver_id}_{int(time.time() * 1000)}",
-                agent_id=message.receiver_id,
-                memory_type=MemoryType.EPISODIC,
-                content=f"Cognitive response from {message.sender_id}: {message.content}",
-                metadata={
-                    'response_to': message.metadata.get('original_request_id'),
-                    'cognitive_response': True,
-                    'sender': message.sender_id
-                }
-            )
-            
-            return {
-                'memory_updates': [memory_item]
+        # Store cognitive response in memory
+        memory_item = MemoryItem(
+            memory_id=f"cog_response_{message.receiver_id}_{self._next_stamp()}",
+            agent_id=message.receiver_id,
+            memory_type=MemoryType.EPISODIC,
+            content=f"Cognitive response from {message.sender_id}: {message.content}",
+            metadata={
+                'response_to': message.metadata.get('original_request_id'),
+                'cognitive_response': True,
+                'sender': message.sender_id
             }
-            
-        except Exception as e:
-            self.logger.error(f"Error handling cognitive response: {e}")
-            return {'errors': [str(e)]}
+        )
+        
+        return {
+            'memory_updates': [memory_item]
+        }
     
     async def _handle_knowledge_share(self, message: EnhancedAILMessage) -> Dict[str, Any]:
         """Handle knowledge sharing message"""
-        try:
-            # Store shared knowledge
-            memory_item = MemoryItem(
-                memory_id=f"knowledge_share_{message.receiver_id}_{int(time.time() * 1000)}",
-                agent_id=message.receiver_id,
-                memory_type=MemoryType.SEMANTIC,
-                content=f"Shared knowledge from {message.sender_id}: {message.content}",
-                metadata={
-                    'knowledge_source': message.sender_id,
-                    'shared_knowledge': True,
-                    'learning_value': message.learning_value
-                }
-            )
-            
-            # Create learning experience
-            learning_exp = LearningExperience(
-                experience_id=f"knowledge_share_{message.message_id}",
-                agent_id=message.receiver_id,
-                learning_type=LearningType.COLLABORATIVE,
-                context={'knowledge_sharer': message.sender_id},
-                action_taken='receive_shared_knowledge',
-                outcome={'knowledge_acquired': True},
-                success_score=message.learning_value,
-                confidence=0.8
-            )
-            
-            return {
-                'memory_updates': [memory_item],
-                'learning_experiences': [learning_exp]
+        # Store shared knowledge
+        memory_item = MemoryItem(
+            memory_id=f"knowledge_share_{message.receiver_id}_{self._next_stamp()}",
+            agent_id=message.receiver_id,
+            memory_type=MemoryType.SEMANTIC,
+            content=f"Shared knowledge from {message.sender_id}: {message.content}",
+            metadata={
+                'knowledge_source': message.sender_id,
+                'shared_knowledge': True,
+                'learning_value': message.learning_value
             }
-            
-        except Exception as e:
-            self.logger.error(f"Error handling knowledge share: {e}")
-            return {'errors': [str(e)]}
+        )
+        
+        # Create learning experience
+        learning_exp = LearningExperience(
+            experience_id=f"knowledge_share_{message.message_id}",
+            agent_id=message.receiver_id,
+            learning_type=LearningType.COLLABORATIVE,
+            context={'knowledge_sharer': message.sender_id},
+            action_taken='receive_shared_knowledge',
+            outcome={'knowledge_acquired': True},
+            success_score=message.learning_value,
+            confidence=0.8
+        )
+        
+        return {
+            'memory_updates': [memory_item],
+            'learning_experiences': [learning_exp]
+        }
     
     async def _handle_collaboration_invite(self, message: EnhancedAILMessage) -> Dict[str, Any]:
         """Handle collaboration invitation"""
-        try:
-            # Check if receiver can collaborate
-            receiver_attention = await self.attention_manager.get_attention_summary(message.receiver_id)
-            cognitive_load = receiver_attention.get('cognitive_load', 0.0)
-            
-            if cognitive_load < 0.8:  # Can collaborate if not overloaded
-                # Accept collaboration
-                collaboration_id = f"collab_{message.sender_id}_{message.receiver_id}_{int(asyncio.get_event_loop().time())}"
-                
-                self.active_collaborations[collaboration_id] = {
-                    'participants': [message.sender_id, message.receiver_id],
-                    'started_at': datetime.now(timezone.utc),
-                    'context': json.loads(message.content) if message.content.startswith('{') else {'topic': message.content}
-                }
-                
-                # Send acceptance response
-                response = EnhancedAILMessage(
-                    message_id=f"collab_accept_{message.message_id}",
-                    sender_id=message.receiver_id,
-                    receiver_id=message.sender_id,
-                    message_type=AILMessageType.COLLABORATION_INVITE,
-                    cognitive_intent=CognitiveIntentType.COLLABORATE,
-                    content=json.dumps({'status': 'accepted', 'collaboration_id': collaboration_id}),
-                    collaboration_potential=1.0
-                )
-                
-                return {
-                    'response_messages': [response],
-                    'collaboration_opportunities': [collaboration_id]
-                }
-            else:
-                # Decline due to high cognitive load
-                response = EnhancedAILMessage(
-                    message_id=f"collab_decline_{message.message_id}",
-                    sender_id=message.receiver_id,
-                    receiver_id=message.sender_id,
-                    message_type=AILMessageType.COLLABORATION_INVITE,
-                    cognitive_intent=CognitiveIntentType.INFORM,
-                    content=json.dumps({'status': 'declined', 'reason': 'high_cognitive_load'}),
-                    collaboration_potential=0.0
-                )
-                
-                return {
-                    'response_messages': [response]
-                }
+        # Check if receiver can collaborate
+        receiver_attention = await self.attention_manager.get_attention_summary(message.receiver_id)
+        cognitive_load = receiver_attention.get('cognitive_load', 0.0)
+        
+        if cognitive_load < 0.8:  # Can collaborate if not overloaded
+            # Accept collaboration
+            collaboration_id = f"collab_{message.sender_id}_{message.receiver_id}_{int(self._now().timestamp())}"
+            
+            self.active_collaborations[collaboration_id] = {
+                'participants': [message.sender_id, message.receiver_id],
+                'started_at': self._now(),
+                'context': self._get_content_dict(message, 'topic')
+            }
             
-        except Exception as e:
-            self.logger.error(f"Error handling collaboration invite: {e}")
-            return {'errors': [str(e)]}
-    
-    async def _handle_attention_alert(self, message: EnhancedAILMessage) -> Dict[str, Any]:
-        """Handle attention alert message"""
-        try:
-            # Create high-priority attention target
-            attention_target = AttentionTarget(
-                target_id=f"alert_{message.message_id}",
-                target_type='alert',
-                content=message.content,
-                priority=1.0,  # Maximum priority
-                urgency=1.0,
-                relevance=message.attention_priority
+            # Send acceptance response
+            response = EnhancedAILMessage(
+                message_id=f"collab_accept_{message.message_id}",
+                sender_id=message.receiver_id,
+                receiver_id=message.sender_id,
+                message_type=AILMessageType.COLLABORATION_INVITE,
+                cognitive_intent=CognitiveIntentType.COLLABORATE,
+                content=_dumps({'status': 'accepted', 'collaboration_id': collaboration_id}),
+                collaboration_potential=1.0
             )
             
             return {
-                'attention_updates': [attention_target]
+                'response_messages': [response],
+                'collaboration_opportunities': [collaboration_id]
             }
-            
-        except Exception as e:
-            self.logger.error(f"Error handling attention alert: {e}")
-            return {'errors': [str(e)]}
-    
-    async def _handle_learning_feedback(self, message: EnhancedAILMessage) -> Dict[str, Any]:
-        """Handle learning feedback message"""
-        try:
-            feedback_data = json.loads(message.content) if message.content.startswith('{') else {'feedback': message.content}
-            
-            # Create learning experience from feedback
-            learning_exp = LearningExperience(
-                experience_id=f"feedback_{message.message_id}",
-                agent_id=message.receiver_id,
-                learning_type=LearningType.INSTRUCTIONAL,
-                context={'feedback_provider': message.sender_id},
-                action_taken='receive_feedback',
-                outcome={'feedback_received': True},
-                feedback=feedback_data,
-                success_score=0.7,
-                confidence=message.learning_value
+        else:
+            # Decline due to high cognitive load
+            response = EnhancedAILMessage(
+                message_id=f"collab_decline_{message.message_id}",
+                sender_id=message.receiver_id,
+                receiver_id=message.sender_id,
+                message_type=AILMessageType.COLLABORATION_INVITE,
+                cognitive_intent=CognitiveIntentType.INFORM,
+                content=_dumps({'status': 'declined', 'reason': 'high_cognitive_load'}),
+                collaboration_potential=0.0
             )
             
             return {
-                'learning_experiences': [learning_exp]
+                'response_messages': [response]
             }
-            
-        except Exception as e:
-            self.logger.error(f"Error handling learning feedback: {e}")
-            return {'errors': [str(e)]}
+    
+    async def _handle_attention_alert(self, message: EnhancedAILMessage) -> Dict[str, Any]:
+        """Handle attention alert message"""
+        # Create high-priority attention target
+        attention_target = AttentionTarget(
+            target_id=f"alert_{message.message_id}",
+            target_type='alert',
+            content=message.content,
+            priority=1.0,  # Maximum priority
+            urgency=1.0,
+            relevance=message.attention_priority
+        )
+        
+        return {
+            'attention_updates': [attention_target]
+        }
+    
+    async def _handle_learning_feedback(self, message: EnhancedAILMessage) -> Dict[str, Any]:
+        """Handle learning feedback message"""
+        feedback_data = self._get_content_dict(message, 'feedback')
+        
+        # Create learning experience from feedback
+        learning_exp = LearningExperience(
+            experience_id=f"feedback_{message.message_id}",
+            agent_id=message.receiver_id,
+            learning_type=LearningType.INSTRUCTIONAL,
+            context={'feedback_provider': message.sender_id},
+            action_taken='receive_feedback',
+            outcome={'feedback_received': True},
+            feedback=feedback_data,
+            success_score=0.7,
+            confidence=message.learning_value
+        )
+        
+        return {
+            'learning_experiences': [learning_exp]
+        }
     
     async def _handle_context_sync(self, message: EnhancedAILMessage) -> Dict[str, Any]:
         """Handle context synchronization message"""
-        try:
-            context_data = json.loads(message.content) if message.content.startswith('{') else {'context': message.content}
-            
-            # Store context information
-            memory_item = MemoryItem(
-                memory_id=f"context_sync_{message.receiver_id}_{int(time.time() * 1000)}",
-                agent_id=message.receiver_id,
-                memory_type=MemoryType.EPISODIC,
-                content=f"Context sync from {message.sender_id}: {json.dumps(context_data)}",
-                metadata={
-                    'context_sync': True,
-                    'source_agent': message.sender_id,
-                    'sync_timestamp': datetime.now(timezone.utc).isoformat()
-                }
-            )
-            
-            return {
-                'memory_updates': [memory_item]
+        context_data = self._get_content_dict(message, 'context')
+        
+        # Store context information
+        memory_item = MemoryItem(
+            memory_id=f"context_sync_{message.receiver_id}_{self._next_stamp()}",
+            agent_id=message.receiver_id,
+            memory_type=MemoryType.EPISODIC,
+            content=f"Context sync from {message.sender_id}: {_dumps(context_data)}",
+            metadata={
+                'context_sync': True,
+                'source_agent': message.sender_id,
+                'sync_timestamp': self._now().isoformat()
             }
-            
-        except Exception as e:
-            self.logger.error(f"Error handling context sync: {e}")
-            return {'errors': [str(e)]}
+        )
+        
+        return {
+            'memory_updates': [memory_item]
+        }
     
     async def _handle_reasoning_trace(self, message: EnhancedAILMessage) -> Dict[str, Any]:
         """Handle reasoning trace sharing"""
-        try:
-            trace_data = json.loads(message.content) if message.content.startswith('{') else {'trace': message.content}
-            
-            # Store reasoning trace for learning
-            memory_item = MemoryItem(
-                memory_id=f"reasoning_trace_{message.receiver_id}_{int(time.time() * 1000)}",
-                agent_id=message.receiver_id,
-                memory_type=MemoryType.PROCEDURAL,
-                content=f"Reasoning trace from {message.sender_id}: {json.dumps(trace_data)}",
-                metadata={
-                    'reasoning_trace': True,
-                    'source_agent': message.sender_id,
-                    'learning_opportunity': True
-                }
-            )
-            
-            # Create learning experience
-            learning_exp = LearningExperience(
-                experience_id=f"reasoning_trace_{message.message_id}",
-                agent_id=message.receiver_id,
-                learning_type=LearningType.OBSERVATIONAL,
-                context={'reasoning_source': message.sender_id, 'trace': trace_data},
-                action_taken='observe_reasoning',
-                outcome={'reasoning_observed': True},
-                success_score=0.8,
-                confidence=message.learning_value
-            )
-            
-            return {
-                'memory_updates': [memory_item],
-                'learning_experiences': [learning_exp]
+        trace_data = self._get_content_dict(message, 'trace')
+        
+        # Store reasoning trace for learning
+        memory_item = MemoryItem(
+            memory_id=f"reasoning_trace_{message.receiver_id}_{self._next_stamp()}",
+            agent_id=message.receiver_id,
+            memory_type=MemoryType.PROCEDURAL,
+            content=f"Reasoning trace from {message.sender_id}: {_dumps(trace_data)}",
+            metadata={
+                'reasoning_trace': True,
+                'source_agent': message.sender_id,
+                'learning_opportunity': True
             }
-            
-        except Exception as e:
-            self.logger.error(f"Error handling reasoning trace: {e}")
-            return {'errors': [str(e)]}
+        )
+        
+        # Create learning experience
+        learning_exp = LearningExperience(
+            experience_id=f"reasoning_trace_{message.message_id}",
+            agent_id=message.receiver_id,
+            learning_type=LearningType.OBSERVATIONAL,
+            context={'reasoning_source': message.sender_id, 'trace': trace_data},
+            action_taken='observe_reasoning',
+            outcome={'reasoning_observed': True},
+            success_score=0.8,
+            confidence=message.learning_value
+        )
+        
+        return {
+            'memory_updates': [memory_item],
+            'learning_experiences': [learning_exp]
+        }
     
     async def _handle_query(self, message: EnhancedAILMessage) -> Dict[str, Any]:
         """Handle query message (legacy support)"""
@@ -703,96 +1206,135 @@ class EnhancedAILProcessor:
     
     async def _handle_notification(self, message: EnhancedAILMessage) -> Dict[str, Any]:
         """Handle notification message"""
-        try:
-            # Store notification
-            memory_item = MemoryItem(
-                memory_id=f"notification_{message.receiver_id}_{int(time.time() * 1000)}",
-                agent_id=message.receiver_id,
-                memory_type=MemoryType.EPISODIC,
-                content=f"Notification from {message.sender_id}: {message.content}",
-                metadata={
-                    'notification': True,
-                    'source_agent': message.sender_id,
-                    'priority': message.attention_priority
-                }
-            )
-            
-            return {
-                'memory_updates': [memory_item]
+        # Store notification
+        memory_item = MemoryItem(
+            memory_id=f"notification_{message.receiver_id}_{self._next_stamp()}",
+            agent_id=message.receiver_id,
+            memory_type=MemoryType.EPISODIC,
+            content=f"Notification from {message.sender_id}: {message.content}",
+            metadata={
+                'notification': True,
+                'source_agent': message.sender_id,
+                'priority': message.attention_priority
             }
-            
-        except Exception as e:
-            self.logger.error(f"Error handling notification: {e}")
-            return {'errors': [str(e)]}
+        )
+        
+        return {
+            'memory_updates': [memory_item]
+        }
     
     async def _handle_command(self, message: EnhancedAILMessage) -> Dict[str, Any]:
         """Handle command message"""
-        try:
-            # Process command with cognitive engine
-            command_result = await self.cognitive_engine.process_cognitive_request(
-                agent_id=message.receiver_id,
-                process_type=CognitiveProcessType.DECISION_MAKING,
-                input_data={'command': message.content, 'commander': message.sender_id}
-            )
-            
-            # Store command execution
-            memory_item = MemoryItem(
-                memory_id=f"command_{message.receiver_id}_{int(time.time() * 1000)}",
-                agent_id=message.receiver_id,
-                memory_type=MemoryType.PROCEDURAL,
-                content=f"Command from {message.sender_id}: {message.content}",
-                metadata={
-                    'command': True,
-                    'commander': message.sender_id,
-                    'execution_result': command_result.result_data
-                }
-            )
-            
-            return {
-                'cognitive_response': command_result,
-                'memory_updates': [memory_item]
+        # Process command with cognitive engine
+        command_result = await self.cognitive_engine.process_cognitive_request(
+            agent_id=message.receiver_id,
+            process_type=CognitiveProcessType.DECISION_MAKING,
+            input_data={'command': message.content, 'commander': message.sender_id}
+        )
+        
+        # Store command execution
+        memory_item = MemoryItem(
+            memory_id=f"command_{message.receiver_id}_{self._next_stamp()}",
+            agent_id=message.receiver_id,
+            memory_type=MemoryType.PROCEDURAL,
+            content=f"Command from {message.sender_id}: {message.content}",
+            metadata={
+                'command': True,
+                'commander': message.sender_id,
+                'execution_result': command_result.result_data
             }
-            
-        except Exception as e:
-            self.logger.error(f"Error handling command: {e}")
-            return {'errors': [str(e)]}
+        )
+        
+        return {
+            'cognitive_response': command_result,
+            'memory_updates': [memory_item]
+        }
     
     async def _handle_processing_result(self, result: AILProcessingResult):
         """Handle the result of message processing"""
         try:
-            # Apply attention updates
-            for attention_target in result.attention_updates:
-                await self.attention_manager.set_primary_focus(
-                    agent_id=attention_target.target_id.split('_')[0],  # Extract agent ID
-                    target=attention_target
-                )
-            
-            # Add learning experiences
-            for learning_exp in result.learning_experiences:
-                await self.learning_loop.add_learning_experience(learning_exp)
-            
-            # Store memory updates
-            for memory_item in result.memory_updates:
-                await self.memory_interface.store_memory_item(memory_item)
-            
-            # Send response messages
-            for response_msg in result.response_messages:
-                await self.send_enhanced_ail_message(response_msg)
+            # Memory updates are persisted in the background while there is room
+            if result.memory_updates:
+                await self._persist_memory(result.message_id, result.memory_updates)
+            
+            # Responses go straight out (the outbox already batches bus sends) while
+            # attention and learning updates join the current micro-batches
+            pending = [self.send_enhanced_ail_message(msg) for msg in result.response_messages]
+            pending.extend(self._attention_batcher.submit(target) for target in result.attention_updates)
+            pending.extend(self._learning_batcher.submit(exp) for exp in result.learning_experiences)
+            
+            if pending:
+                outcomes = await asyncio.gather(*pending, return_exceptions=True)
+                for outcome in outcomes:
+                    if isinstance(outcome, Exception):
+                        self.logger.error(f"Error applying result of {result.message_id}: {outcome}")
             
             # Log processing result
             if result.errors:
                 self.logger.warning(f"Processing errors for {result.message_id}: {result.errors}")
             else:
                 self.logger.debug(f"Successfully processed message {result.message_id} in {result.processing_time:.3f}s")
-            
+        
         except Exception as e:
             self.logger.error(f"Error handling processing result: {e}")
     
+    async def _persist_memory(self, message_id: str, memory_items: List[MemoryItem]):
+        """
+        Store a message's memory updates without waiting for the write. Once too
+        many writes are pending the write is awaited instead, so a backlog slows
+        the worker down rather than losing updates.
+        """
+        if len(self._cold_tasks) >= self.max_cold_tasks:
+            await self._persist_memory_updates(message_id, memory_items)
+            return
+        task = asyncio.create_task(self._persist_memory_updates(message_id, memory_items))
+        self._cold_tasks.add(task)
+        task.add_done_callback(self._cold_tasks.discard)
+    
+    async def _persist_memory_updates(self, message_id: str, memory_items: List[MemoryItem]):
+        """Store memory updates through the memory micro-batcher"""
+        async with self._cold_sem:
+            outcomes = await asyncio.gather(
+                *(self._memory_batcher.submit(item) for item in memory_items),
+                return_exceptions=True
+            )
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                self.logger.error(f"Error storing memory update for {message_id}: {outcome}")
+    
+    async def _store_memory_items(self, memory_items: List[MemoryItem]) -> List[str]:
+        """Store one micro-batch of memory updates as parallel columns"""
+        return await self.memory_interface.store_memory_batch(
+            [m.memory_id for m in memory_items],
+            [m.agent_id for m in memory_items],
+            [m.memory_type for m in memory_items],
+            [m.content for m in memory_items],
+            [m.metadata for m in memory_items]
+        )
+    
+    async def _apply_attention_updates(self, targets: List[AttentionTarget]) -> List[Any]:
+        """Apply a batch of attention updates, one bulk call per agent"""
+        positions_by_agent: Dict[str, List[int]] = defaultdict(list)
+        for position, target in enumerate(targets):
+            positions_by_agent[target.target_id.partition('_')[0]].append(position)  # Extract agent ID
+        
+        agent_results = await asyncio.gather(
+            *(self.attention_manager.set_primary_focus_bulk(agent_id, [targets[i] for i in positions])
+              for agent_id, positions in positions_by_agent.items()),
+            return_exceptions=True
+        )
+        
+        results: List[Any] = [None] * len(targets)
+        for positions, outcome in zip(positions_by_agent.values(), agent_results):
+            for i, position in enumerate(positions):
+                results[position] = outcome if isinstance(outcome, Exception) else outcome[i]
+        return results
+    
     def get_processing_stats(self) -> Dict[str, Any]:
         """Get processing statistics"""
         try:
-            total_messages = sum(len(history) for history in self.message_history.values())
-            active_queues = sum(len(queue) for queue in self.processing_queue.values())
+            total_messages = self._total_messages
+            active_queues = self._queued_messages
             active_collaborations = len(self.active_collaborations)
             
             return {
@@ -803,7 +1345,7 @@ class EnhancedAILProcessor:
                 'message_types_supported': len(self.message_handlers),
                 'running': self._running
             }
-            
+        
         except Exception as e:
             self.logger.error(f"Error getting processing stats: {e}")
             return {'error': str(e)}
@@ -811,6 +1353,7 @@ class EnhancedAILProcessor:
 
 # Global enhanced AIL processor instance
 _global_enhanced_ail_processor: Optional[EnhancedAILProcessor] = None
+_init_lock = threading.Lock()
 
 
 def get_enhanced_ail_processor(memory_interface: Optional[UnifiedMemoryInterface] = None,
@@ -821,59 +1364,92 @@ def get_enhanced_ail_processor(memory_interface: Optional[UnifiedMemoryInterface
     """Get the global enhanced AIL processor instance"""
     global _global_enhanced_ail_processor
     
-    if _global_enhanced_ail_processor is None:
-        if memory_interface is None:
-            from .memory_interface import get_memory_interface
-            memory_interface = get_memory_interface()
-        
-        if message_bus is None:
-            from .message_bus import get_message_bus
-            message_bus = get_message_bus()
-        
-        if cognitive_engine is None:
-            from .cognitive_engine import get_cognitive_engine
-            cognitive_engine = get_cognitive_engine()
-        
-        if attention_manager is None:
-            from .attention_manager import get_attention_manager
-            attention_manager = get_attention_manager()
-        
-        if learning_loop is None:
-            from .learning_loop import get_learning_loop
-            learning_loop = get_learning_loop()
-        
-        _global_enhanced_ail_processor = EnhancedAILProcessor(
-            memory_interface, message_bus, cognitive_engine, attention_manager, learning_loop
-        )
+    processor = _global_enhanced_ail_processor
+    if processor is not None:
+        return processor
+    
+    with _init_lock:
+        if _global_enhanced_ail_processor is None:
+            if memory_interface is None:
+                from .memory_interface import get_memory_interface
+                memory_interface = get_memory_interface()
+            
+            if message_bus is None:
+                from .message_bus import get_message_bus
+                message_bus = get_message_bus()
+            
+            if cognitive_engine is None:
+                from .cognitive_engine import get_cognitive_engine
+                cognitive_engine = get_cognitive_engine()
+            
+            if attention_manager is None:
+                from .attention_manager import get_attention_manager
+                attention_manager = get_attention_manager()
+            
+            if learning_loop is None:
+                from .learning_loop import get_learning_loop
+                learning_loop = get_learning_loop()
+            
+            _global_enhanced_ail_processor = EnhancedAILProcessor(
+                memory_interface, message_bus, cognitive_engine, attention_manager, learning_loop
+            )
     
     return _global_enhanced_ail_processor
 
 
-async def send_cognitive_request(sender_id: str, receiver_id: str, query: str, 
-                               process_type: CognitiveProcessType = CognitiveProcessType.REASONING) -> bool:
-    """Helper function to send a cognitive request"""
-    processor = get_enhanced_ail_processor()
+# Cognitive request contents have a fixed shape, so only the query needs encoding
+_COGNITIVE_REQUEST_TEMPLATE = '{"query":%s,"process_type":%s}'
+_PROCESS_TYPE_JSON = {process_type: _dumps(process_type.value) for process_type in CognitiveProcessType}
+
+
+@functools.lru_cache(maxsize=1024)
+def _cognitive_request_content(query: str, process_type: CognitiveProcessType) -> str:
+    """JSON content of a cognitive request, reused for repeated queries"""
+    return _COGNITIVE_REQUEST_TEMPLATE % (_dumps(query), _PROCESS_TYPE_JSON[process_type])
+
+
+def _build_cognitive_request(processor: EnhancedAILProcessor, sender_id: str, receiver_id: str,
+                             query: str, process_type: CognitiveProcessType) -> EnhancedAILMessage:
+    """Build a cognitive request message"""
     message = EnhancedAILMessage(
-        message_id=f"cog_req_{sender_id}_{int(asyncio.get_event_loop().time() * 1000)}",
+        message_id=f"cog_req_{sender_id}_{processor._next_stamp()}",
         sender_id=sender_id,
         receiver_id=receiver_id,
         message_type=AILMessageType.COGNITIVE_REQUEST,
         cognitive_intent=CognitiveIntentType.REQUEST,
-        content=json.dumps({'query': query, 'process_type': process_type.value}),
+        content=_cognitive_request_content(query, process_type),
         attention_priority=0.8,
         learning_value=0.7
     )
     message.cognitive_context.required_cognitive_processes = [process_type]
-    
+    return message
+
+
+async def send_cognitive_request(sender_id: str, receiver_id: str, query: str, 
+                               process_type: CognitiveProcessType = CognitiveProcessType.REASONING) -> bool:
+    """Helper function to send a cognitive request"""
+    processor = get_enhanced_ail_processor()
+    message = _build_cognitive_request(processor, sender_id, receiver_id, query, process_type)
     return await processor.send_enhanced_ail_message(message)
 
 
+async def send_cognitive_requests(requests: List[Tuple[str, str, str]],
+                                  process_type: CognitiveProcessType = CognitiveProcessType.REASONING) -> List[bool]:
+    """Helper function to send (sender_id, receiver_id, query) cognitive requests in one batch"""
+    processor = get_enhanced_ail_processor()
+    messages = [
+        _build_cognitive_request(processor, sender_id, receiver_id, query, process_type)
+        for sender_id, receiver_id, query in requests
+    ]
+    return await processor.send_enhanced_ail_messages(messages)
+
+
 async def share_knowledge(sender_id: str, receiver_id: str, knowledge: str, 
                          knowledge_type: str = 'general') -> bool:
     """Helper function to share knowledge"""
     processor = get_enhanced_ail_processor()
     message = EnhancedAILMessage(
-        message_id=f"knowledge_{sender_id}_{int(asyncio.get_event_loop().time() * 1000)}",
+        message_id=f"knowledge_{sender_id}_{processor._next_stamp()}",
         sender_id=sender_id,
         receiver_id=receiver_id,
         message_type=AILMessageType.KNOWLEDGE_SHARE,
@@ -882,7 +1458,7 @@ async def share_knowledge(sender_id: str, receiver_id: str, knowledge: str,
         attention_priority=0.7,
         learning_value=0.9,
         collaboration_potential=0.6,
-        semantic_tags=[knowledge_type, 'knowledge_sharing']
+        semantic_tags=[sys.intern(knowledge_type), 'knowledge_sharing']
     )
     
     return await processor.send_enhanced_ail_message(message)
@@ -17,20 +17,52 @@ Key Features:
 
 import asyncio
 import logging
-import time
 import json
-from typing import Dict, List, Optional, Any, Set, Tuple, Callable
+import re
+from typing import Dict, List, Mapping, Optional, Any, Set, Tuple, Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from types import MappingProxyType
 from datetime import datetime, timezone
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
+from itertools import islice
 import numpy as np
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from ._batch_clock import BatchClock
+from ._compat import DATACLASS_SLOTS
+from ._learning_kernels import consolidate_patterns
 from .memory_interface import UnifiedMemoryInterface, MemoryType, MemoryItem, MemoryQuery
 from .message_bus import UnifiedMessageBus, Message, MessageType, MessagePriority
 from .cognitive_engine import CognitiveEngine, CognitiveProcessType, CognitiveResult
 
 
+# Compact JSON encoding for pattern conditions and outcomes; orjson is used when installed
+if orjson is not None:
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, separators=(',', ':'), default=str)
+
+# Field names of the learning history records, which are stored as tuples
+_HISTORY_FIELDS = ('experience_id', 'learning_type', 'success_score',
+                   'knowledge_extracted', 'patterns_extracted', 'timestamp')
+
+# Cues that an instruction describes a procedure, matched anywhere in the text
+_PROCEDURAL_CUE_RE = re.compile(r'how to|step|procedure|process', re.IGNORECASE)
+
+# Cues that a knowledge item is social knowledge, matched anywhere in the content
+_SOCIAL_CUE_RE = re.compile(r'collaborative|social', re.IGNORECASE)
+
+# Wall clock read once per processed batch and shared by its experiences
+_BATCH_CLOCK = BatchClock('learning_batch_clock')
+
+
 class LearningType(Enum):
     """Types of learning"""
     EXPERIENTIAL = "experiential"      # Learning from direct experience
@@ -41,6 +73,10 @@ class LearningType(Enum):
     EXPERIMENTAL = "experimental"      # Learning from experimentation
 
 
+# Position of each learning type, used to index the strategy table
+_LEARNING_TYPE_INDEX = {learning_type: index for index, learning_type in enumerate(LearningType)}
+
+
 class LearningMode(Enum):
     """Learning modes"""
     PASSIVE = "passive"                # Background learning
@@ -59,7 +95,7 @@ class KnowledgeType(Enum):
     CONTEXTUAL = "contextual"          # Context-specific knowledge
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LearningExperience:
     """An experience that can be learned from"""
     experience_id: str
@@ -76,9 +112,17 @@ class LearningExperience:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     processed: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _context_json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def context_json(self) -> str:
+        """JSON serialization of context, computed once and reused by the strategies"""
+        if self._context_json is None:
+            self._context_json = _dumps(self.context)
+        return self._context_json
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LearningPattern:
     """A learned pattern or rule"""
     pattern_id: str
@@ -96,7 +140,7 @@ class LearningPattern:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class KnowledgeItem:
     """A piece of learned knowledge"""
     knowledge_id: str
@@ -114,7 +158,7 @@ class KnowledgeItem:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LearningGoal:
     """A learning objective"""
     goal_id: str
@@ -131,7 +175,7 @@ class LearningGoal:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class LearningState:
     """Current learning state of an agent"""
     agent_id: str
@@ -146,6 +190,19 @@ class LearningState:
     last_learning_event: Optional[datetime] = None
     total_learning_events: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Exact-match lookups for pattern and knowledge deduplication
+    pattern_index: Dict[Tuple[str, str, str], LearningPattern] = field(default_factory=dict)
+    # Patterns by (pattern_type, action, outcome), the groups fused during consolidation
+    outcome_groups: Dict[Tuple[str, str, str], Dict[str, LearningPattern]] = field(default_factory=dict)
+    knowledge_index: Dict[Tuple[KnowledgeType, str], KnowledgeItem] = field(default_factory=dict)
+    # Aggregates over knowledge_base kept up to date as items are added and removed
+    knowledge_type_counts: Counter = field(default_factory=Counter)
+    social_knowledge_count: int = 0
+    # Aggregates over learned_patterns kept up to date as patterns change
+    pattern_type_counts: Counter = field(default_factory=Counter)
+    weak_pattern_count: int = 0
+    # Patterns that changed, or are still being strengthened, since the last consolidation
+    dirty_patterns: Set[str] = field(default_factory=set)
 
 
 class LearningLoop:
@@ -167,35 +224,68 @@ class LearningLoop:
         # Learning state tracking
         self.agent_states: Dict[str, LearningState] = {}
         self.pending_experiences: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
+        self._pending_agents: Set[str] = set()  # agents with experiences waiting to be processed
+        
+        # Ids of recently added experiences, used to drop re-submissions
+        self.dedup_window = 1000  # experience ids remembered per agent
+        self._recent_experience_ids: Dict[str, deque] = {}
+        self._experience_id_sets: Dict[str, Set[str]] = {}
         self.learning_histories: Dict[str, deque] = defaultdict(lambda: deque(maxlen=200))
         
         # Learning parameters
         self.min_pattern_support = 3
         self.max_pattern_contradictions = 1
+        self.weak_pattern_threshold = 0.6
         self.knowledge_confidence_threshold = 0.6
+        self.max_knowledge_items = 5000  # per agent; the least important items are evicted beyond this
         self.experience_batch_size = 5
-        self.learning_update_interval = 10.0  # seconds
+        self.learning_update_interval = 10.0  # seconds between passes when no experiences arrive
+        self.experience_flush_interval = 0.05  # seconds to wait for a partial batch to fill
         self.consolidation_interval = 60.0    # seconds
+        self.max_concurrent_agents = 8  # agents processed or consolidated at once
         
-        # Learning strategies
-        self.learning_strategies: Dict[LearningType, Callable] = {}
+        # Learning strategies; learning_strategies is a read-only view, change it through
+        # register_learning_strategy so the dispatch table stays in sync
+        self._learning_strategies: Dict[LearningType, Callable] = {}
+        self.learning_strategies: Mapping[LearningType, Callable] = MappingProxyType(self._learning_strategies)
         self._register_learning_strategies()
         
         # Background processing
         self._learning_loop_task = None
         self._consolidation_task = None
+        self._experience_event: Optional[asyncio.Event] = None  # created in start()
+        self._concurrency_sem: Optional[asyncio.Semaphore] = None  # created in start()
+        
+        # Knowledge memories are written by a background flusher in batches
+        self._store_queue: Optional[asyncio.Queue] = None  # created lazily inside the running loop
+        self._store_task: Optional[asyncio.Task] = None
+        self.store_queue_max_size = 10000
+        self.store_batch_size = 64
+        self.store_flush_interval = 0.05  # seconds
         self._running = False
     
     def _register_learning_strategies(self):
         """Register learning strategy handlers"""
-        self.learning_strategies = {
+        self._learning_strategies.update({
             LearningType.EXPERIENTIAL: self._process_experiential_learning,
             LearningType.OBSERVATIONAL: self._process_observational_learning,
             LearningType.INSTRUCTIONAL: self._process_instructional_learning,
             LearningType.REFLECTIVE: self._process_reflective_learning,
             LearningType.COLLABORATIVE: self._process_collaborative_learning,
             LearningType.EXPERIMENTAL: self._process_experimental_learning,
-        }
+        })
+        self._rebuild_strategy_table()
+    
+    def register_learning_strategy(self, learning_type: LearningType, strategy: Callable):
+        """Register or replace the strategy for a learning type"""
+        self._learning_strategies[learning_type] = strategy
+        self._rebuild_strategy_table()
+    
+    def _rebuild_strategy_table(self):
+        """Rebuild the list-indexed strategy table from the registered strategies"""
+        self._strategy_table: Tuple[Optional[Callable], ...] = tuple(
+            self._learning_strategies.get(learning_type) for learning_type in LearningType
+        )
     
     async def start(self):
         """Start the learning loop"""
@@ -203,6 +293,10 @@ class LearningLoop:
             return
         
         self._running = True
+        self._experience_event = asyncio.Event()
+        self._concurrency_sem = asyncio.Semaphore(self.max_concurrent_agents)
+        if self._pending_agents:
+            self._experience_event.set()
         self._learning_loop_task = asyncio.create_task(self._learning_loop())
         self._consolidation_task = asyncio.create_task(self._consolidation_loop())
         self.logger.info("Learning loop started")
@@ -225,17 +319,44 @@ class LearningLoop:
             except asyncio.CancelledError:
                 pass
         
+        # Let the store flusher write everything already queued, then exit
+        if self._store_task:
+            if not self._store_task.done():
+                await self._store_queue.put(None)
+                try:
+                    await self._store_task
+                except asyncio.CancelledError:
+                    pass
+            self._store_task = None
+        await self._flush_store_remaining()
+        
         self.logger.info("Learning loop stopped")
     
     async def _learning_loop(self):
         """Main learning processing loop"""
+        event = self._experience_event
         while self._running:
             try:
-                # Process pending experiences for all agents
-                for agent_id in list(self.pending_experiences.keys()):
-                    await self._process_pending_experiences(agent_id)
+                # Wake when experiences arrive, or periodically as a fallback
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=self.learning_update_interval)
+                except asyncio.TimeoutError:
+                    pass
+                event.clear()
+                
+                # Give partial batches a moment to fill before flushing them
+                if not any(len(self.pending_experiences[agent_id]) >= self.experience_batch_size
+                           for agent_id in self._pending_agents):
+                    await asyncio.sleep(self.experience_flush_interval)
                 
-                await asyncio.sleep(self.learning_update_interval)
+                # Process one batch per agent with pending experiences
+                await asyncio.gather(*(
+                    self._run_limited(self._process_pending_experiences, agent_id)
+                    for agent_id in list(self._pending_agents)
+                ))
+                
+                if self._pending_agents:
+                    event.set()
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -247,8 +368,10 @@ class LearningLoop:
         while self._running:
             try:
                 # Consolidate knowledge for all agents
-                for agent_id in list(self.agent_states.keys()):
-                    await self._consolidate_knowledge(agent_id)
+                await asyncio.gather(*(
+                    self._run_limited(self._consolidate_knowledge, agent_id)
+                    for agent_id in list(self.agent_states.keys())
+                ))
                 
                 await asyncio.sleep(self.consolidation_interval)
             except asyncio.CancelledError:
@@ -257,6 +380,11 @@ class LearningLoop:
                 self.logger.error(f"Error in consolidation loop: {e}")
                 await asyncio.sleep(5.0)
     
+    async def _run_limited(self, func: Callable, agent_id: str):
+        """Run a per-agent coroutine function under the agent concurrency limit"""
+        async with self._concurrency_sem:
+            await func(agent_id)
+    
     async def register_agent(self, agent_id: str) -> LearningState:
         """Register an agent with the learning loop"""
         if agent_id not in self.agent_states:
@@ -268,10 +396,15 @@ class LearningLoop:
     async def add_learning_experience(self, experience: LearningExperience) -> bool:
         """Add a learning experience for processing"""
         try:
+            if self._is_duplicate_experience(experience):
+                self.logger.debug(f"Skipped duplicate learning experience {experience.experience_id}")
+                return True
+            
             await self.register_agent(experience.agent_id)
             
             # Add to pending experiences
             self.pending_experiences[experience.agent_id].append(experience)
+            self._notify_pending(experience.agent_id)
             
             # Update learning state
             state = self.agent_states[experience.agent_id]
@@ -286,35 +419,187 @@ class LearningLoop:
             self.logger.error(f"Error adding learning experience: {e}")
             return False
     
+    async def add_learning_experiences(self, experiences: List[LearningExperience]) -> List[bool]:
+        """Add several learning experiences, sharing one timestamp across the batch"""
+        results = []
+        now = datetime.now(timezone.utc)
+        for experience in experiences:
+            try:
+                if self._is_duplicate_experience(experience):
+                    results.append(True)
+                    continue
+                
+                state = self.agent_states.get(experience.agent_id)
+                if state is None:
+                    state = await self.register_agent(experience.agent_id)
+                
+                self.pending_experiences[experience.agent_id].append(experience)
+                self._notify_pending(experience.agent_id)
+                state.recent_experiences.append(experience)
+                state.last_learning_event = now
+                state.total_learning_events += 1
+                results.append(True)
+                
+            except Exception as e:
+                self.logger.error(f"Error adding learning experience: {e}")
+                results.append(False)
+        
+        self.logger.debug(f"Added {sum(results)} of {len(experiences)} learning experiences")
+        return results
+    
+    def _is_duplicate_experience(self, experience: LearningExperience) -> bool:
+        """
+        Check whether an experience with the same id was recently added for the
+        agent, remembering the id if it was not. Distinct experiences with the
+        same content are kept, since repeats are what reinforce patterns.
+        """
+        experience_id = experience.experience_id
+        agent_id = experience.agent_id
+        seen = self._experience_id_sets.get(agent_id)
+        if seen is None:
+            seen = self._experience_id_sets[agent_id] = set()
+            self._recent_experience_ids[agent_id] = deque()
+        if experience_id in seen:
+            return True
+        
+        recent = self._recent_experience_ids[agent_id]
+        if len(recent) >= self.dedup_window:
+            seen.discard(recent.popleft())
+        recent.append(experience_id)
+        seen.add(experience_id)
+        return False
+    
+    def _notify_pending(self, agent_id: str):
+        """Mark an agent as having pending experiences and wake the learning loop"""
+        self._pending_agents.add(agent_id)
+        if self._experience_event is not None:
+            self._experience_event.set()
+    
     async def _process_pending_experiences(self, agent_id: str):
         """Process pending learning experiences for an agent"""
         try:
             pending = self.pending_experiences[agent_id]
             if not pending:
+                self._pending_agents.discard(agent_id)
                 return
             
             # Process experiences in batches
             batch = []
             while pending and len(batch) < self.experience_batch_size:
                 batch.append(pending.popleft())
+            if not pending:
+                self._pending_agents.discard(agent_id)
             
             if not batch:
                 return
             
-            # Process each experience
-            for experience in batch:
-                await self._process_learning_experience(experience)
+            # Process each experience, collecting new knowledge memories for the store flusher
+            memory_items: List[MemoryItem] = []
+            with _BATCH_CLOCK.batch():
+                for experience in batch:
+                    await self._process_learning_experience(experience, memory_items)
+            
+            if memory_items:
+                store_queue = self._get_store_queue()
+                for memory_item in memory_items:
+                    await store_queue.put(memory_item)
             
             self.logger.debug(f"Processed {len(batch)} learning experiences for {agent_id}")
             
         except Exception as e:
             self.logger.error(f"Error processing pending experiences for {agent_id}: {e}")
     
-    async def _process_learning_experience(self, experience: LearningExperience):
-        """Process a single learning experience"""
+    def _get_store_queue(self) -> asyncio.Queue:
+        """Get the pending memory write queue, starting its flusher on first use"""
+        if self._store_queue is None:
+            self._store_queue = asyncio.Queue(maxsize=self.store_queue_max_size)
+        if self._store_task is None or self._store_task.done():
+            self._store_task = asyncio.create_task(self._store_loop())
+        return self._store_queue
+    
+    async def _store_loop(self):
+        """Write queued knowledge memories in batches until a None sentinel is queued"""
+        store_queue = self._store_queue
+        stopping = False
+        while not stopping:
+            try:
+                item = await store_queue.get()
+                if item is None:
+                    break
+                batch = [item]
+                
+                # Give a burst a moment to accumulate unless a full batch is already waiting
+                if store_queue.qsize() < self.store_batch_size - 1:
+                    await asyncio.sleep(self.store_flush_interval)
+                while len(batch) < self.store_batch_size:
+                    try:
+                        item = store_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+                
+                await self._store_memory_items(batch)
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                self.logger.error(f"Error storing knowledge memories: {e}")
+    
+    async def _flush_store_remaining(self):
+        """Write whatever is still queued for the memory interface"""
+        if self._store_queue is None:
+            return
+        batch = []
+        while True:
+            try:
+                item = self._store_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            if item is not None:
+                batch.append(item)
+        if batch:
+            try:
+                await self._store_memory_items(batch)
+            except Exception as e:
+                self.logger.error(f"Error storing knowledge memories: {e}")
+    
+    async def _store_memory_items(self, memory_items: List[MemoryItem]) -> List[str]:
+        """Write a batch of knowledge memories with one store_memory_batch call"""
+        return await self.memory_interface.store_memory_batch(
+            [m.memory_id for m in memory_items],
+            [m.agent_id for m in memory_items],
+            [m.memory_type for m in memory_items],
+            [m.content for m in memory_items],
+            [m.metadata for m in memory_items]
+        )
+    
+    @staticmethod
+    def _now() -> datetime:
+        """Time of the batch being processed, or the live clock outside a batch"""
+        return _BATCH_CLOCK.now()
+    
+    @staticmethod
+    def _now_iso() -> str:
+        """ISO-8601 form of ``_now()``"""
+        return _BATCH_CLOCK.now_iso()
+    
+    @staticmethod
+    def _next_stamp() -> str:
+        """Unique time stamp for record ids: clock milliseconds plus a running counter"""
+        return _BATCH_CLOCK.next_stamp()
+    
+    async def _process_learning_experience(self, experience: LearningExperience,
+                                           memory_items: Optional[List[MemoryItem]] = None):
+        """
+        Process a single learning experience.
+        New knowledge memories are appended to ``memory_items`` when given,
+        otherwise they are stored immediately.
+        """
         try:
             # Get appropriate learning strategy
-            strategy = self.learning_strategies.get(experience.learning_type)
+            strategy = self._strategy_table[_LEARNING_TYPE_INDEX[experience.learning_type]]
             if not strategy:
                 self.logger.warning(f"No strategy for learning type: {experience.learning_type}")
                 return
@@ -324,7 +609,7 @@ class LearningLoop:
             
             # Extract patterns and knowledge
             await self._extract_patterns(experience, learning_result)
-            await self._extract_knowledge(experience, learning_result)
+            await self._extract_knowledge(experience, learning_result, memory_items)
             
             # Update learning efficiency
             await self._update_learning_efficiency(experience.agent_id, learning_result)
@@ -332,15 +617,15 @@ class LearningLoop:
             # Mark as processed
             experience.processed = True
             
-            # Store learning event in history
-            self.learning_histories[experience.agent_id].append({
-                'experience_id': experience.experience_id,
-                'learning_type': experience.learning_type.value,
-                'success_score': experience.success_score,
-                'knowledge_extracted': len(learning_result.get('knowledge_items', [])),
-                'patterns_extracted': len(learning_result.get('patterns', [])),
-                'timestamp': datetime.now(timezone.utc).isoformat()
-            })
+            # Store learning event in history (fields as in _HISTORY_FIELDS)
+            self.learning_histories[experience.agent_id].append((
+                experience.experience_id,
+                experience.learning_type.value,
+                experience.success_score,
+                len(learning_result.get('knowledge_items', [])),
+                len(learning_result.get('patterns', [])),
+                self._now_iso()
+            ))
             
         except Exception as e:
             self.logger.error(f"Error processing learning experience {experience.experience_id}: {e}")
@@ -358,27 +643,27 @@ class LearningLoop:
             if experience.action_taken and experience.outcome:
                 # Create causal pattern
                 pattern = LearningPattern(
-                    pattern_id=f"pattern_{experience.agent_id}_{int(time.time() * 1000)}",
+                    pattern_id=f"pattern_{experience.agent_id}_{self._next_stamp()}",
                     agent_id=experience.agent_id,
                     pattern_type="causal",
-                    condition=json.dumps(experience.context),
+                    condition=experience.context_json,
                     action=experience.action_taken,
-                    outcome=json.dumps(experience.outcome),
+                    outcome=_dumps(experience.outcome),
                     confidence=experience.success_score,
-                    contexts=[json.dumps(experience.context)]
+                    contexts=[experience.context_json]
                 )
                 result['patterns'].append(pattern)
             
             # Extract procedural knowledge
             if experience.success_score > 0.7:
                 knowledge = KnowledgeItem(
-                    knowledge_id=f"knowledge_{experience.agent_id}_{int(time.time() * 1000)}",
+                    knowledge_id=f"knowledge_{experience.agent_id}_{self._next_stamp()}",
                     agent_id=experience.agent_id,
                     knowledge_type=KnowledgeType.PROCEDURAL,
                     content=f"In context {experience.context}, action '{experience.action_taken}' leads to {experience.outcome}",
                     confidence=experience.success_score,
                     source="experiential_learning",
-                    applicability_contexts=[json.dumps(experience.context)]
+                    applicability_contexts=[experience.context_json]
                 )
                 result['knowledge_items'].append(knowledge)
             
@@ -410,20 +695,20 @@ class LearningLoop:
             if observed_action and observed_outcome:
                 # Create observational pattern
                 pattern = LearningPattern(
-                    pattern_id=f"obs_pattern_{experience.agent_id}_{int(time.time() * 1000)}",
+                    pattern_id=f"obs_pattern_{experience.agent_id}_{self._next_stamp()}",
                     agent_id=experience.agent_id,
                     pattern_type="observational",
-                    condition=json.dumps(experience.context),
+                    condition=experience.context_json,
                     action=observed_action,
-                    outcome=json.dumps(observed_outcome),
+                    outcome=_dumps(observed_outcome),
                     confidence=experience.confidence * 0.8,  # Slightly lower confidence for observed learning
-                    contexts=[json.dumps(experience.context)]
+                    contexts=[experience.context_json]
                 )
                 result['patterns'].append(pattern)
                 
                 # Create strategic knowledge
                 knowledge = KnowledgeItem(
-                    knowledge_id=f"obs_knowledge_{experience.agent_id}_{int(time.time() * 1000)}",
+                    knowledge_id=f"obs_knowledge_{experience.agent_id}_{self._next_stamp()}",
                     agent_id=experience.agent_id,
                     knowledge_type=KnowledgeType.STRATEGIC,
                     content=f"Observed: {observed_agent} used '{observed_action}' resulting in {observed_outcome}",
@@ -453,7 +738,7 @@ class LearningLoop:
             if instruction:
                 # Create factual knowledge
                 knowledge = KnowledgeItem(
-                    knowledge_id=f"inst_knowledge_{experience.agent_id}_{int(time.time() * 1000)}",
+                    knowledge_id=f"inst_knowledge_{experience.agent_id}_{self._next_stamp()}",
                     agent_id=experience.agent_id,
                     knowledge_type=KnowledgeType.FACTUAL,
                     content=instruction,
@@ -463,9 +748,9 @@ class LearningLoop:
                 result['knowledge_items'].append(knowledge)
                 
                 # Extract any procedural steps
-                if any(word in instruction.lower() for word in ['how to', 'step', 'procedure', 'process']):
+                if _PROCEDURAL_CUE_RE.search(instruction):
                     proc_knowledge = KnowledgeItem(
-                        knowledge_id=f"proc_knowledge_{experience.agent_id}_{int(time.time() * 1000)}",
+                        knowledge_id=f"proc_knowledge_{experience.agent_id}_{self._next_stamp()}",
                         agent_id=experience.agent_id,
                         knowledge_type=KnowledgeType.PROCEDURAL,
                         content=instruction,
@@ -503,21 +788,22 @@ class LearningLoop:
                 )
                 
                 # Extract insights from reflection
-                for insight in reflection_result.reasoning_trace:
-                    result['insights'].append(insight)
+                result['insights'].extend(reflection_result.reasoning_trace)
                 
                 # Create metacognitive knowledge
-                if reflection_result.result_data.get('insights'):
-                    for insight in reflection_result.result_data['insights']:
-                        knowledge = KnowledgeItem(
-                            knowledge_id=f"meta_knowledge_{experience.agent_id}_{int(time.time() * 1000)}",
-                            agent_id=experience.agent_id,
-                            knowledge_type=KnowledgeType.METACOGNITIVE,
-                            content=insight,
-                            confidence=reflection_result.confidence,
-                            source="reflective_learning"
-                        )
-                        result['knowledge_items'].append(knowledge)
+                agent_id = experience.agent_id
+                confidence = reflection_result.confidence
+                result['knowledge_items'] = [
+                    KnowledgeItem(
+                        knowledge_id=f"meta_knowledge_{agent_id}_{self._next_stamp()}",
+                        agent_id=agent_id,
+                        knowledge_type=KnowledgeType.METACOGNITIVE,
+                        content=insight,
+                        confidence=confidence,
+                        source="reflective_learning"
+                    )
+                    for insight in reflection_result.result_data.get('insights') or ()
+                ]
             
             return result
             
@@ -541,21 +827,21 @@ class LearningLoop:
             # Extract collaborative patterns
             if collaborators and collaboration_outcome:
                 pattern = LearningPattern(
-                    pattern_id=f"collab_pattern_{experience.agent_id}_{int(time.time() * 1000)}",
+                    pattern_id=f"collab_pattern_{experience.agent_id}_{self._next_stamp()}",
                     agent_id=experience.agent_id,
                     pattern_type="collaborative",
                     condition=f"collaborating_with_{len(collaborators)}_agents",
                     action=experience.action_taken,
-                    outcome=json.dumps(collaboration_outcome),
+                    outcome=_dumps(collaboration_outcome),
                     confidence=experience.success_score,
-                    contexts=[json.dumps(experience.context)]
+                    contexts=[experience.context_json]
                 )
                 result['patterns'].append(pattern)
             
             # Extract shared knowledge
             for knowledge_item in shared_knowledge:
                 knowledge = KnowledgeItem(
-                    knowledge_id=f"shared_knowledge_{experience.agent_id}_{int(time.time() * 1000)}",
+                    knowledge_id=f"shared_knowledge_{experience.agent_id}_{self._next_stamp()}",
                     agent_id=experience.agent_id,
                     knowledge_type=KnowledgeType.CONCEPTUAL,
                     content=str(knowledge_item),
@@ -586,20 +872,20 @@ class LearningLoop:
             # Extract experimental patterns
             if hypothesis and experiment_result:
                 pattern = LearningPattern(
-                    pattern_id=f"exp_pattern_{experience.agent_id}_{int(time.time() * 1000)}",
+                    pattern_id=f"exp_pattern_{experience.agent_id}_{self._next_stamp()}",
                     agent_id=experience.agent_id,
                     pattern_type="experimental",
                     condition=f"hypothesis: {hypothesis}",
                     action=f"experiment with variables: {variables}",
-                    outcome=json.dumps(experiment_result),
+                    outcome=_dumps(experiment_result),
                     confidence=experience.success_score,
-                    contexts=[json.dumps(experience.context)]
+                    contexts=[experience.context_json]
                 )
                 result['patterns'].append(pattern)
                 
                 # Create factual knowledge about the experiment
                 knowledge = KnowledgeItem(
-                    knowledge_id=f"exp_knowledge_{experience.agent_id}_{int(time.time() * 1000)}",
+                    knowledge_id=f"exp_knowledge_{experience.agent_id}_{self._next_stamp()}",
                     agent_id=experience.agent_id,
                     knowledge_type=KnowledgeType.FACTUAL,
                     content=f"Experimental finding: {hypothesis} -> {experiment_result}",
@@ -617,62 +903,87 @@ class LearningLoop:
     async def _extract_patterns(self, experience: LearningExperience, learning_result: Dict[str, Any]):
         """Extract and store learning patterns"""
         try:
-            state = self.agent_states[experience.agent_id]
+            patterns = learning_result.get('patterns')
+            if not patterns:
+                return
             
-            for pattern in learning_result.get('patterns', []):
+            agent_id = experience.agent_id
+            state = self.agent_states[agent_id]
+            now = self._now()
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            
+            for pattern in patterns:
                 # Check if similar pattern already exists
-                existing_pattern = await self._find_similar_pattern(experience.agent_id, pattern)
+                existing_pattern = await self._find_similar_pattern(agent_id, pattern)
                 
                 if existing_pattern:
                     # Update existing pattern
                     existing_pattern.support_count += 1
-                    existing_pattern.confidence = (existing_pattern.confidence + pattern.confidence) / 2
-                    existing_pattern.last_updated = datetime.now(timezone.utc)
-                    if pattern.contexts[0] not in existing_pattern.contexts:
-                        existing_pattern.contexts.extend(pattern.contexts)
+                    state.dirty_patterns.add(existing_pattern.pattern_id)
+                    self._set_pattern_confidence(
+                        state, existing_pattern, (existing_pattern.confidence + pattern.confidence) / 2
+                    )
+                    existing_pattern.last_updated = now
+                    contexts = existing_pattern.contexts
+                    if pattern.contexts[0] not in contexts:
+                        contexts.extend(pattern.contexts)
                 else:
                     # Store new pattern
-                    state.learned_patterns[pattern.pattern_id] = pattern
+                    self._add_pattern(state, pattern)
                 
-                self.logger.debug(f"Extracted pattern for {experience.agent_id}: {pattern.pattern_id}")
+                if debug:
+                    self.logger.debug(f"Extracted pattern for {agent_id}: {pattern.pattern_id}")
                 
         except Exception as e:
             self.logger.error(f"Error extracting patterns: {e}")
     
-    async def _extract_knowledge(self, experience: LearningExperience, learning_result: Dict[str, Any]):
+    async def _extract_knowledge(self, experience: LearningExperience, learning_result: Dict[str, Any],
+                                 memory_items: Optional[List[MemoryItem]] = None):
         """Extract and store knowledge items"""
         try:
-            state = self.agent_states[experience.agent_id]
+            knowledge_items = learning_result.get('knowledge_items')
+            if not knowledge_items:
+                return
+            
+            agent_id = experience.agent_id
+            state = self.agent_states[agent_id]
+            now = self._now()
+            now_iso = self._now_iso()
+            debug = self.logger.isEnabledFor(logging.DEBUG)
             
-            for knowledge in learning_result.get('knowledge_items', []):
+            for knowledge in knowledge_items:
                 # Check if similar knowledge already exists
-                existing_knowledge = await self._find_similar_knowledge(experience.agent_id, knowledge)
+                existing_knowledge = await self._find_similar_knowledge(agent_id, knowledge)
                 
                 if existing_knowledge:
                     # Update existing knowledge
                     existing_knowledge.evidence_count += 1
                     existing_knowledge.confidence = (existing_knowledge.confidence + knowledge.confidence) / 2
-                    existing_knowledge.last_updated = datetime.now(timezone.utc)
+                    existing_knowledge.last_updated = now
                 else:
                     # Store new knowledge
-                    state.knowledge_base[knowledge.knowledge_id] = knowledge
+                    self._add_knowledge(state, knowledge)
                     
                     # Also store in memory interface
                     memory_item = MemoryItem(
-                        memory_id=f"knowledge_{experience.agent_id}_{knowledge.knowledge_id}",
-                        agent_id=experience.agent_id,
+                        memory_id=f"knowledge_{agent_id}_{knowledge.knowledge_id}",
+                        agent_id=agent_id,
                         memory_type=MemoryType.SEMANTIC,
                         content=knowledge.content,
                         metadata={
                             'knowledge_type': knowledge.knowledge_type.value,
                             'confidence': knowledge.confidence,
                             'source': knowledge.source,
-                            'learning_timestamp': datetime.now(timezone.utc).isoformat()
+                            'learning_timestamp': now_iso
                         }
                     )
-                    await self.memory_interface.store_memory_item(memory_item)
+                    if memory_items is None:
+                        await self.memory_interface.store_memory_item(memory_item)
+                    else:
+                        memory_items.append(memory_item)
                 
-                self.logger.debug(f"Extracted knowledge for {experience.agent_id}: {knowledge.knowledge_id}")
+                if debug:
+                    self.logger.debug(f"Extracted knowledge for {agent_id}: {knowledge.knowledge_id}")
                 
         except Exception as e:
             self.logger.error(f"Error extracting knowledge: {e}")
@@ -682,13 +993,17 @@ class LearningLoop:
         try:
             state = self.agent_states[agent_id]
             
-            for existing_pattern in state.learned_patterns.values():
-                if (existing_pattern.pattern_type == pattern.pattern_type and
-                    existing_pattern.condition == pattern.condition and
-                    existing_pattern.action == pattern.action):
-                    return existing_pattern
+            key = self._pattern_key(pattern)
+            existing_pattern = state.pattern_index.get(key)
+            if existing_pattern is None:
+                return None
             
-            return None
+            # Drop entries for patterns that were removed or replaced
+            if state.learned_patterns.get(existing_pattern.pattern_id) is not existing_pattern:
+                del state.pattern_index[key]
+                return None
+            
+            return existing_pattern
             
         except Exception as e:
             self.logger.error(f"Error finding similar pattern: {e}")
@@ -699,17 +1014,98 @@ class LearningLoop:
         try:
             state = self.agent_states[agent_id]
             
-            for existing_knowledge in state.knowledge_base.values():
-                if (existing_knowledge.knowledge_type == knowledge.knowledge_type and
-                    existing_knowledge.content.lower() == knowledge.content.lower()):
-                    return existing_knowledge
+            key = self._knowledge_key(knowledge)
+            existing_knowledge = state.knowledge_index.get(key)
+            if existing_knowledge is None:
+                return None
             
-            return None
+            # Drop entries for knowledge that was merged away or replaced
+            if state.knowledge_base.get(existing_knowledge.knowledge_id) is not existing_knowledge:
+                del state.knowledge_index[key]
+                return None
+            
+            return existing_knowledge
             
         except Exception as e:
             self.logger.error(f"Error finding similar knowledge: {e}")
             return None
     
+    def _add_pattern(self, state: LearningState, pattern: LearningPattern):
+        """Add a pattern to the agent's learned patterns, index and aggregates"""
+        state.learned_patterns[pattern.pattern_id] = pattern
+        state.pattern_index[self._pattern_key(pattern)] = pattern
+        group_key = (pattern.pattern_type, pattern.action, pattern.outcome)
+        group = state.outcome_groups.get(group_key)
+        if group is None:
+            group = state.outcome_groups[group_key] = {}
+        group[pattern.pattern_id] = pattern
+        state.pattern_type_counts[pattern.pattern_type] += 1
+        state.dirty_patterns.add(pattern.pattern_id)
+        if pattern.confidence < self.weak_pattern_threshold:
+            state.weak_pattern_count += 1
+    
+    def _remove_pattern(self, state: LearningState, pattern: LearningPattern):
+        """Remove a pattern from the agent's learned patterns, index and aggregates"""
+        del state.learned_patterns[pattern.pattern_id]
+        for condition in (pattern.condition, *pattern.metadata.get('merged_conditions', ())):
+            key = (pattern.pattern_type, condition, pattern.action)
+            if state.pattern_index.get(key) is pattern:
+                del state.pattern_index[key]
+        group_key = (pattern.pattern_type, pattern.action, pattern.outcome)
+        group = state.outcome_groups.get(group_key)
+        if group is not None:
+            group.pop(pattern.pattern_id, None)
+            if not group:
+                del state.outcome_groups[group_key]
+        state.pattern_type_counts[pattern.pattern_type] -= 1
+        if pattern.confidence < self.weak_pattern_threshold:
+            state.weak_pattern_count -= 1
+    
+    def _set_pattern_confidence(self, state: LearningState, pattern: LearningPattern, confidence: float):
+        """Update a stored pattern's confidence, tracking when it crosses the weak threshold"""
+        threshold = self.weak_pattern_threshold
+        was_weak = pattern.confidence < threshold
+        pattern.confidence = confidence
+        is_weak = confidence < threshold
+        if was_weak != is_weak:
+            state.weak_pattern_count += 1 if is_weak else -1
+    
+    def _add_knowledge(self, state: LearningState, knowledge: KnowledgeItem):
+        """Add a knowledge item to the agent's knowledge base, index and aggregates"""
+        state.knowledge_base[knowledge.knowledge_id] = knowledge
+        state.knowledge_index[self._knowledge_key(knowledge)] = knowledge
+        state.knowledge_type_counts[knowledge.knowledge_type] += 1
+        if self._is_social_knowledge(knowledge):
+            state.social_knowledge_count += 1
+    
+    def _remove_knowledge(self, state: LearningState, knowledge: KnowledgeItem):
+        """Remove a knowledge item from the agent's knowledge base, index and aggregates"""
+        del state.knowledge_base[knowledge.knowledge_id]
+        key = self._knowledge_key(knowledge)
+        if state.knowledge_index.get(key) is knowledge:
+            del state.knowledge_index[key]
+        state.knowledge_type_counts[knowledge.knowledge_type] -= 1
+        if self._is_social_knowledge(knowledge):
+            state.social_knowledge_count -= 1
+    
+    @staticmethod
+    def _is_social_knowledge(knowledge: KnowledgeItem) -> bool:
+        """Whether a knowledge item counts towards an agent's social knowledge"""
+        return _SOCIAL_CUE_RE.search(knowledge.content) is not None
+    
+    @staticmethod
+    def _pattern_key(pattern: LearningPattern) -> Tuple[str, str, str]:
+        """Patterns with the same type, condition and action are merged"""
+        return (pattern.pattern_type, pattern.condition, pattern.action)
+    
+    @staticmethod
+    def _knowledge_key(knowledge: KnowledgeItem) -> Tuple[KnowledgeType, str]:
+        """
+        Knowledge of the same type and content is merged. Content is compared
+        case-insensitively, ignoring runs of whitespace and closing punctuation.
+        """
+        return (knowledge.knowledge_type, ' '.join(knowledge.content.lower().split()).rstrip('.!?'))
+    
     async def _update_learning_efficiency(self, agent_id: str, learning_result: Dict[str, Any]):
         """Update learning efficiency metrics"""
         try:
@@ -719,7 +1115,9 @@ class LearningLoop:
             knowledge_count = len(learning_result.get('knowledge_items', []))
             pattern_count = len(learning_result.get('patterns', []))
             
-            efficiency_score = min(1.0, (knowledge_count + pattern_count) / 3.0)
+            efficiency_score = (knowledge_count + pattern_count) / 3.0
+            if efficiency_score > 1.0:
+                efficiency_score = 1.0
             
             # Update running average
             state.learning_efficiency = (state.learning_efficiency * 0.9) + (efficiency_score * 0.1)
@@ -732,56 +1130,152 @@ class LearningLoop:
         try:
             state = self.agent_states[agent_id]
             
-            # Strengthen high-confidence patterns
-            for pattern in state.learned_patterns.values():
-                if pattern.support_count >= self.min_pattern_support:
-                    pattern.confidence = min(1.0, pattern.confidence * 1.05)
-            
-            # Remove contradicted patterns
-            patterns_to_remove = []
-            for pattern_id, pattern in state.learned_patterns.items():
-                if pattern.contradiction_count > self.max_pattern_contradictions:
-                    patterns_to_remove.append(pattern_id)
+            # Only patterns that changed or are still being strengthened need a look
+            dirty_patterns = state.dirty_patterns
+            state.dirty_patterns = set()
+            
+            learned_patterns = state.learned_patterns
+            patterns = [learned_patterns[pid] for pid in dirty_patterns if pid in learned_patterns]
+            
+            if patterns:
+                # Strengthen well-supported patterns and flag contradicted ones in one kernel pass
+                n = len(patterns)
+                confidences = np.fromiter((p.confidence for p in patterns), dtype=np.float64, count=n)
+                support = np.fromiter((p.support_count for p in patterns), dtype=np.int64, count=n)
+                contradictions = np.fromiter((p.contradiction_count for p in patterns), dtype=np.int64, count=n)
+                strengthened, contradicted = consolidate_patterns(
+                    confidences, support, contradictions,
+                    self.min_pattern_support, self.max_pattern_contradictions
+                )
+                
+                # Patterns below full confidence keep strengthening on the next pass
+                for i in np.flatnonzero(strengthened).tolist():
+                    pattern = patterns[i]
+                    confidence = float(confidences[i])
+                    self._set_pattern_confidence(state, pattern, confidence)
+                    if confidence < 1.0:
+                        state.dirty_patterns.add(pattern.pattern_id)
+                
+                # Remove contradicted patterns
+                for i in np.flatnonzero(contradicted).tolist():
+                    pattern = patterns[i]
+                    self._remove_pattern(state, pattern)
+                    state.dirty_patterns.discard(pattern.pattern_id)
+                    self.logger.debug(f"Removed contradicted pattern: {pattern.pattern_id}")
             
-            for pattern_id in patterns_to_remove:
-                del state.learned_patterns[pattern_id]
-                self.logger.debug(f"Removed contradicted pattern: {pattern_id}")
+            # Fuse changed patterns with others leading from the same action to the same outcome
+            await self._consolidate_related_patterns(agent_id, dirty_patterns)
             
             # Consolidate related knowledge
             await self._consolidate_related_knowledge(agent_id)
             
+            # Keep the knowledge base within capacity
+            await self._evict_knowledge(agent_id)
+            
             self.logger.debug(f"Consolidated knowledge for {agent_id}")
             
         except Exception as e:
             self.logger.error(f"Error consolidating knowledge for {agent_id}: {e}")
     
+    async def _consolidate_related_patterns(self, agent_id: str, pattern_ids: Set[str]):
+        """
+        Fuse patterns that share type, action and outcome across different conditions.
+        Only the groups of the given (changed) patterns are checked, since every other
+        group was already fused on an earlier pass.
+        """
+        try:
+            state = self.agent_states[agent_id]
+            
+            group_keys = set()
+            for pattern_id in pattern_ids:
+                pattern = state.learned_patterns.get(pattern_id)
+                if pattern is not None:
+                    group_keys.add((pattern.pattern_type, pattern.action, pattern.outcome))
+            
+            # Merge each group into its highest confidence pattern
+            for group_key in group_keys:
+                group = list(state.outcome_groups.get(group_key, {}).values())
+                if len(group) < 2:
+                    continue
+                primary = max(group, key=lambda p: p.confidence)
+                merged_conditions = primary.metadata.setdefault('merged_conditions', [])
+                for other in group:
+                    if other is primary:
+                        continue
+                    primary.support_count += other.support_count
+                    primary.contradiction_count += other.contradiction_count
+                    for context in other.contexts:
+                        if context not in primary.contexts:
+                            primary.contexts.append(context)
+                    # Remove the merged pattern, keeping its conditions on the primary
+                    self._remove_pattern(state, other)
+                    for condition in (other.condition, *other.metadata.get('merged_conditions', ())):
+                        if condition != primary.condition and condition not in merged_conditions:
+                            merged_conditions.append(condition)
+                        # Later experiences under a merged condition reinforce the primary
+                        state.pattern_index.setdefault((primary.pattern_type, condition, primary.action), primary)
+                primary.last_updated = self._now()
+                state.dirty_patterns.add(primary.pattern_id)
+                self.logger.debug(f"Fused {len(group)} patterns into {primary.pattern_id}")
+            
+        except Exception as e:
+            self.logger.error(f"Error consolidating related patterns: {e}")
+    
     async def _consolidate_related_knowledge(self, agent_id: str):
         """Consolidate related knowledge items"""
         try:
             state = self.agent_states[agent_id]
             
-            # Group knowledge by type and similarity
-            knowledge_groups = defaultdict(list)
+            # Find the highest confidence item for each type and content prefix in one pass
+            primaries: Dict[Tuple[KnowledgeType, str], KnowledgeItem] = {}
+            absorbed: List[Tuple[Tuple[KnowledgeType, str], KnowledgeItem]] = []
             for knowledge in state.knowledge_base.values():
-                key = f"{knowledge.knowledge_type.value}_{knowledge.content[:50]}"
-                knowledge_groups[key].append(knowledge)
-            
-            # Merge similar knowledge items
-            for group in knowledge_groups.values():
-                if len(group) > 1:
-                    # Keep the highest confidence item and merge evidence
-                    primary = max(group, key=lambda k: k.confidence)
-                    for other in group:
-                        if other != primary:
-                            primary.evidence_count += other.evidence_count
-                            primary.contradiction_count += other.contradiction_count
-                            # Remove the merged item
-                            if other.knowledge_id in state.knowledge_base:
-                                del state.knowledge_base[other.knowledge_id]
+                key = (knowledge.knowledge_type, knowledge.content[:50])
+                primary = primaries.get(key)
+                if primary is None:
+                    primaries[key] = knowledge
+                elif knowledge.confidence > primary.confidence:
+                    primaries[key] = knowledge
+                    absorbed.append((key, primary))
+                else:
+                    absorbed.append((key, knowledge))
+            
+            # Merge evidence into the primary item and remove the rest
+            for key, other in absorbed:
+                primary = primaries[key]
+                primary.evidence_count += other.evidence_count
+                primary.contradiction_count += other.contradiction_count
+                self._remove_knowledge(state, other)
             
         except Exception as e:
             self.logger.error(f"Error consolidating related knowledge: {e}")
     
+    async def _evict_knowledge(self, agent_id: str):
+        """Evict the least important knowledge once an agent's knowledge base exceeds capacity"""
+        try:
+            state = self.agent_states[agent_id]
+            excess = len(state.knowledge_base) - self.max_knowledge_items
+            if excess <= 0:
+                return
+            
+            # Importance: confidence weighted by evidence, decaying by a point per idle day
+            items = list(state.knowledge_base.values())
+            now = datetime.now(timezone.utc).timestamp()
+            confidences = np.fromiter((k.confidence for k in items), dtype=np.float64, count=len(items))
+            evidence = np.fromiter((k.evidence_count for k in items), dtype=np.float64, count=len(items))
+            idle_days = (now - np.fromiter((k.last_updated.timestamp() for k in items),
+                                           dtype=np.float64, count=len(items))) / 86400.0
+            importance = confidences * np.log1p(evidence) - idle_days
+            
+            # Select the bottom `excess` items without a full sort
+            for i in np.argpartition(importance, excess - 1)[:excess]:
+                self._remove_knowledge(state, items[i])
+            
+            self.logger.debug(f"Evicted {excess} knowledge items for {agent_id}")
+            
+        except Exception as e:
+            self.logger.error(f"Error evicting knowledge for {agent_id}: {e}")
+    
     async def set_learning_goal(self, agent_id: str, goal: LearningGoal) -> bool:
         """Set a learning goal for an agent"""
         try:
@@ -806,11 +1300,7 @@ class LearningLoop:
             recommendations = []
             
             # Recommend exploring areas with low knowledge
-            knowledge_types = [k.knowledge_type for k in state.knowledge_base.values()]
-            missing_types = []
-            for kt in KnowledgeType:
-                if kt not in knowledge_types:
-                    missing_types.append(kt)
+            missing_types = [kt for kt in KnowledgeType if not state.knowledge_type_counts[kt]]
             
             for missing_type in missing_types[:3]:  # Top 3 missing types
                 recommendations.append({
@@ -821,19 +1311,16 @@ class LearningLoop:
                 })
             
             # Recommend strengthening weak patterns
-            weak_patterns = [p for p in state.learned_patterns.values() if p.confidence < 0.6]
-            if weak_patterns:
+            if state.weak_pattern_count:
                 recommendations.append({
                     'type': 'pattern_strengthening',
-                    'recommendation': f"Practice scenarios to strengthen {len(weak_patterns)} weak patterns",
+                    'recommendation': f"Practice scenarios to strengthen {state.weak_pattern_count} weak patterns",
                     'priority': 0.8,
                     'learning_type': LearningType.EXPERIENTIAL.value
                 })
             
             # Recommend collaborative learning if low social knowledge
-            social_knowledge = [k for k in state.knowledge_base.values() 
-                             if 'collaborative' in k.content.lower() or 'social' in k.content.lower()]
-            if len(social_knowledge) < 3:
+            if state.social_knowledge_count < 3:
                 recommendations.append({
                     'type': 'collaboration',
                     'recommendation': "Engage in collaborative learning to build social knowledge",
@@ -856,14 +1343,16 @@ class LearningLoop:
             state = self.agent_states[agent_id]
             
             # Calculate knowledge distribution
-            knowledge_distribution = defaultdict(int)
-            for knowledge in state.knowledge_base.values():
-                knowledge_distribution[knowledge.knowledge_type.value] += 1
+            knowledge_distribution = {
+                knowledge_type.value: count
+                for knowledge_type, count in state.knowledge_type_counts.items() if count
+            }
             
             # Calculate pattern distribution
-            pattern_distribution = defaultdict(int)
-            for pattern in state.learned_patterns.values():
-                pattern_distribution[pattern.pattern_type] += 1
+            pattern_distribution = {
+                pattern_type: count
+                for pattern_type, count in state.pattern_type_counts.items() if count
+            }
             
             return {
                 'agent_id': agent_id,
@@ -873,8 +1362,8 @@ class LearningLoop:
                 'active_goals': len(state.active_goals),
                 'knowledge_base_size': len(state.knowledge_base),
                 'learned_patterns_count': len(state.learned_patterns),
-                'knowledge_distribution': dict(knowledge_distribution),
-                'pattern_distribution': dict(pattern_distribution),
+                'knowledge_distribution': knowledge_distribution,
+                'pattern_distribution': pattern_distribution,
                 'recent_experiences': len(state.recent_experiences),
                 'last_learning_event': state.last_learning_event.isoformat() if state.last_learning_event else None
             }
@@ -885,8 +1374,17 @@ class LearningLoop:
     
     def get_learning_history(self, agent_id: str, limit: int = 20) -> List[Dict[str, Any]]:
         """Get learning history for an agent"""
-        history = list(self.learning_histories.get(agent_id, deque()))
-        return history[-limit:] if history else []
+        history = self.learning_histories.get(agent_id)
+        if not history:
+            return []
+        
+        if limit > 0:
+            # Walk back from the newest record so only the requested tail is copied
+            records = list(islice(reversed(history), limit))
+            records.reverse()
+        else:
+            records = list(history)[-limit:]
+        return [dict(zip(_HISTORY_FIELDS, record)) for record in records]
 
 
 # Global learning loop instance
@@ -923,7 +1421,7 @@ async def add_agent_experience(agent_id: str, learning_type: LearningType,
     """Helper function to add a learning experience"""
     loop = get_learning_loop()
     experience = LearningExperience(
-        experience_id=f"exp_{agent_id}_{int(time.time() * 1000)}",
+        experience_id=f"exp_{agent_id}_{loop._next_stamp()}",
         agent_id=agent_id,
         learning_type=learning_type,
         context=context,
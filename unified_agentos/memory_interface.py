@@ -22,6 +22,8 @@ from typing import Dict, List, Any, Optional, Set, Union
 from dataclasses import dataclass, field
 from enum import Enum
 
+from ._compat import DATACLASS_SLOTS
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +35,7 @@ class MemoryType(Enum):
     WORKING = "working"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class MemoryItem:
     """Unified memory item structure"""
     memory_id: str
@@ -191,6 +193,44 @@ class UnifiedMemoryInterface:
             logger.error(f"Error storing memory item: {e}")
             raise
 
+    async def store_memory_batch(
+        self,
+        memory_ids: List[str],
+        agent_ids: List[str],
+        memory_types: List[MemoryType],
+        contents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ) -> List[str]:
+        """
+        Store a batch of memories given as parallel columns.
+        Returns the memory IDs in input order.
+        """
+        if not (len(memory_ids) == len(agent_ids) == len(memory_types) == len(contents) == len(metadatas)):
+            raise ValueError("Memory batch columns must have the same length")
+        
+        try:
+            memory_items = [
+                MemoryItem(memory_id=memory_id, agent_id=agent_id, memory_type=memory_type,
+                           content=content, metadata=metadata)
+                for memory_id, agent_id, memory_type, content, metadata
+                in zip(memory_ids, agent_ids, memory_types, contents, metadatas)
+            ]
+            
+            # Store in backend with a single bulk write
+            await self._store_batch_to_backend(memory_items)
+            
+            # Update cache and statistics
+            for memory_item in memory_items:
+                await self._cache.put(f"memory_{memory_item.memory_id}", memory_item)
+                await self._update_stats_after_store(memory_item)
+            
+            logger.debug(f"Stored batch of {len(memory_items)} memory items")
+            return list(memory_ids)
+            
+        except Exception as e:
+            logger.error(f"Error storing memory batch: {e}")
+            raise
+
     async def store_memory(
         self,
         agent_id: str,
@@ -418,6 +458,14 @@ class UnifiedMemoryInterface:
             self._agent_memories[memory_item.agent_id] = []
         self._agent_memories[memory_item.agent_id].append(memory_item.memory_id)
     
+    async def _store_batch_to_backend(self, memory_items: List[MemoryItem]):
+        """Store several memory items to backend storage in one write"""
+        self._memory_store.update((memory_item.memory_id, memory_item) for memory_item in memory_items)
+        
+        # Index by agent
+        for memory_item in memory_items:
+            self._agent_memories.setdefault(memory_item.agent_id, []).append(memory_item.memory_id)
+    
     async def _query_backend(self, query: MemoryQuery) -> List[MemoryItem]:
         """Query backend storage for memories"""
         results = []